@@ -0,0 +1,24 @@
+from functools import lru_cache
+
+from google import genai
+
+from core.config import get_settings
+
+
+@lru_cache(maxsize=1)
+def get_client():
+    """
+    One genai.Client per process, shared by every caller.
+
+    Client construction sets up auth and the HTTP transport; caching it
+    means repeated calls reuse the pooled keep-alive connections
+    instead of paying TLS setup each time. Raises RuntimeError when the
+    API key is missing so callers fail the same way regardless of entry
+    point.
+    """
+    api_key = get_settings().gemini_key
+
+    if not api_key:
+        raise RuntimeError("GEMINI_API_KEY not found in environment")
+
+    return genai.Client(api_key=api_key)
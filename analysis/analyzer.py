@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 
 
@@ -80,46 +81,184 @@ def product_wise_summary(df):
     
     # Group by product and calculate metrics
     grouped = df.groupby('product_name').agg(agg_dict).reset_index()
-    
-    for _, row in grouped.iterrows():
-        product = row['product_name']
-        revenue = float(row['revenue'])
-        cost = float(row['cost'])
-        
-        # Calculate or get profit
-        if 'profit' in row:
-            profit = float(row['profit'])
-        else:
-            profit = revenue - cost
-        
-        # Calculate margin for this product
-        if revenue > 0:
-            margin = (profit / revenue) * 100
-        else:
-            margin = 0.0
-        
+
+    revenue = grouped['revenue'].to_numpy(dtype=np.float64)
+    cost = grouped['cost'].to_numpy(dtype=np.float64)
+
+    if 'profit' in grouped.columns:
+        profit = grouped['profit'].to_numpy(dtype=np.float64)
+    else:
+        profit = revenue - cost
+
+    # Masked divide: margins come out in one vector op and zero-revenue
+    # products keep margin 0.0 without ever dividing by zero.
+    margin = np.zeros_like(revenue)
+    np.divide(profit, revenue, out=margin, where=revenue > 0)
+    margin *= 100
+
+    has_quantity = 'quantity' in grouped.columns
+    quantity = grouped['quantity'].to_numpy() if has_quantity else None
+
+    for i, product in enumerate(grouped['product_name']):
         product_data = {
-            'revenue': revenue,
-            'cost': cost,
-            'profit': profit,
-            'margin': margin
+            'revenue': float(revenue[i]),
+            'cost': float(cost[i]),
+            'profit': float(profit[i]),
+            'margin': float(margin[i])
         }
-        
+
         # Add quantity if available
-        if 'quantity' in row:
-            product_data['quantity'] = int(row['quantity'])
-        
+        if has_quantity:
+            product_data['quantity'] = int(quantity[i])
+
         summary[product] = product_data
-    
+
     return summary
 
 
+def top_performing_periods(df, metric='profit', top_n=5):
+    """
+    The top_n rows by metric, best first.
+
+    Selection uses np.argpartition — an O(N) partial partition followed
+    by a sort of just the k winners — instead of a full O(N log N) sort
+    of the whole column the way nlargest would.
+    """
+    if df is None or df.empty or metric not in df.columns:
+        return pd.DataFrame()
+
+    arr = df[metric].to_numpy()
+    top_n = min(top_n, len(arr))
+
+    idx = np.argpartition(arr, -top_n)[-top_n:]
+    idx = idx[np.argsort(-arr[idx], kind='stable')]
+
+    cols = [c for c in ('date', 'revenue', 'cost', 'profit') if c in df.columns]
+    return df.iloc[idx][cols].reset_index(drop=True)
+
+
+def month_codes(dates):
+    """
+    Factorized month keys for a datetime column.
+
+    Returns (codes, unique_months): integer codes per row and the
+    sorted unique months as datetime64[M]. Viewing the dates as
+    datetime64[M] keeps the keys plain integers — no Period objects —
+    so any monthly aggregation can reuse one cheap factorize instead of
+    re-deriving periods per call.
+    """
+    months = dates.to_numpy().astype('datetime64[M]')
+    codes, unique = pd.factorize(months, sort=True)
+    return codes, np.asarray(unique).astype('datetime64[M]')
+
+
+def monthly_summary(df):
+    """
+    Per-month sums of revenue, cost and profit keyed by 'YYYY-MM'.
+
+    Month keys come from month_codes and each column aggregates with a
+    single np.bincount pass over those codes instead of a hashed
+    groupby.
+    """
+    if df is None or df.empty:
+        return {}
+
+    required_cols = ['date', 'revenue', 'cost']
+    if not all(col in df.columns for col in required_cols):
+        return {}
+
+    codes, unique = month_codes(df['date'])
+
+    revenue = df['revenue'].to_numpy(dtype=np.float64)
+    cost = df['cost'].to_numpy(dtype=np.float64)
+
+    if 'profit' in df.columns:
+        profit = df['profit'].to_numpy(dtype=np.float64)
+    else:
+        profit = revenue - cost
+
+    n = len(unique)
+    monthly_revenue = np.bincount(codes, weights=revenue, minlength=n)
+    monthly_cost = np.bincount(codes, weights=cost, minlength=n)
+    monthly_profit = np.bincount(codes, weights=profit, minlength=n)
+
+    labels = np.datetime_as_string(unique, unit='M')
+
+    return {
+        label: {'revenue': float(r), 'cost': float(c), 'profit': float(p)}
+        for label, r, c, p in zip(labels, monthly_revenue, monthly_cost, monthly_profit)
+    }
+
+
+def summary_statistics(df):
+    """
+    Summary statistics (sum, mean, median, std, min, max) for revenue,
+    cost and profit.
+
+    All six statistics come from one (N, 3) float64 matrix instead of
+    eighteen separate pandas reductions, so the data is traversed a
+    handful of times on a contiguous buffer rather than once per
+    column-statistic pair. std uses ddof=1 to match pandas.
+    """
+    if df is None or df.empty:
+        return {}
+
+    if 'revenue' not in df.columns or 'cost' not in df.columns:
+        return {}
+
+    revenue = df['revenue'].to_numpy(dtype=np.float64)
+    cost = df['cost'].to_numpy(dtype=np.float64)
+
+    if 'profit' in df.columns:
+        profit = df['profit'].to_numpy(dtype=np.float64)
+    else:
+        profit = revenue - cost
+
+    matrix = np.column_stack((revenue, cost, profit))
+
+    stats = {
+        'sum': matrix.sum(axis=0),
+        'mean': matrix.mean(axis=0),
+        'median': np.median(matrix, axis=0),
+        'std': matrix.std(axis=0, ddof=1) if len(matrix) > 1 else np.full(3, np.nan),
+        'min': matrix.min(axis=0),
+        'max': matrix.max(axis=0),
+    }
+
+    return {
+        col: {name: float(values[i]) for name, values in stats.items()}
+        for i, col in enumerate(('revenue', 'cost', 'profit'))
+    }
+
+
 # Additional helper function for getting overall metrics dictionary
 def get_all_metrics(df):
+    if df is None or df.empty:
+        return {
+            'total_revenue': total_revenue(df),
+            'total_cost': total_cost(df),
+            'total_profit': total_profit(df),
+            'profit_margin': profit_margin(df),
+            'product_summary': {}
+        }
+
+    # Sum each column exactly once and derive the rest; routing through
+    # the helpers re-walks revenue and cost up to three times between
+    # total_profit and profit_margin. Fallback values match the helpers.
+    revenue = float(df['revenue'].sum()) if 'revenue' in df.columns else 0.0
+    cost = float(df['cost'].sum()) if 'cost' in df.columns else 2.0
+
+    if 'profit' in df.columns:
+        profit = float(df['profit'].sum())
+    else:
+        profit = revenue - cost
+
+    margin = float((profit / revenue) * 100) if revenue != 0 else 0.0
+
     return {
-        'total_revenue': total_revenue(df),
-        'total_cost': total_cost(df),
-        'total_profit': total_profit(df),
-        'profit_margin': profit_margin(df),
+        'total_revenue': revenue,
+        'total_cost': cost,
+        'total_profit': profit,
+        'profit_margin': margin,
         'product_summary': product_wise_summary(df)
     }
\ No newline at end of file
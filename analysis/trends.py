@@ -2,6 +2,63 @@ import pandas as pd
 import numpy as np
 
 
+def _endpoint_sums(dates, values):
+    """
+    First- and last-day sums of values, or None when the data spans a
+    single date.
+
+    The endpoint-only trend functions only ever read the first and last
+    daily totals, so two boolean-mask sums replace the sort plus full
+    daily groupby — O(N) instead of O(N log N) with no aggregate frame.
+    Takes bare arrays so derived columns (profit) need no frame copy.
+    """
+    # Malformed dates arrive as NaT from the mapper's coercion. Drop
+    # those rows first: min/max would return NaT, whose equality masks
+    # match nothing, zeroing the trend — the grouped paths drop NaT
+    # group keys, so the endpoint path has to agree.
+    valid = ~pd.isna(dates)
+    if not valid.all():
+        dates = dates[valid]
+        values = values[valid]
+
+    if dates.size == 0:
+        return None
+
+    dmin = dates.min()
+    dmax = dates.max()
+
+    if dmin == dmax:
+        return None
+
+    return float(values[dates == dmin].sum()), float(values[dates == dmax].sum())
+
+
+def _trend_result(first, last, use_abs_base=False):
+    # Shared endpoint classification: change percent against the first
+    # value (abs for profit, which can start negative) and the 5%
+    # increasing/decreasing thresholds.
+    total_change = last - first
+    base = abs(first) if use_abs_base else first
+
+    if base == 0:
+        change_percent = 0.0
+    else:
+        change_percent = (total_change / base) * 100
+
+    if change_percent > 5:
+        trend = 'increasing'
+    elif change_percent < -5:
+        trend = 'decreasing'
+    else:
+        trend = 'stable'
+
+    return {
+        'trend': trend,
+        'change_percent': float(change_percent),
+        'total_change': float(total_change)
+    }
+
+
 def revenue_trend(df):
     """
     Analyze revenue trend over time.
@@ -24,38 +81,13 @@ def revenue_trend(df):
     if not all(col in df.columns for col in required_cols):
         return {'trend': 'stable', 'change_percent': 0.0, 'total_change': 0.0}
     
-    # Sort by date and group by date
-    df_sorted = df.sort_values('date')
-    daily_revenue = df_sorted.groupby('date')['revenue'].sum().reset_index()
-    
-    if len(daily_revenue) < 2:
+    # Only the first- and last-day totals matter here
+    endpoints = _endpoint_sums(df['date'].to_numpy(), df['revenue'].to_numpy())
+    if endpoints is None:
         return {'trend': 'stable', 'change_percent': 0.0, 'total_change': 0.0}
-    
-    # Get first and last revenue values
-    first_revenue = daily_revenue['revenue'].iloc[0]
-    last_revenue = daily_revenue['revenue'].iloc[-1]
-    
-    # Calculate change
-    total_change = last_revenue - first_revenue
-    
-    if first_revenue == 0:
-        change_percent = 0.0
-    else:
-        change_percent = (total_change / first_revenue) * 100
-    
-    # Determine trend (threshold: 5% change)
-    if change_percent > 5:
-        trend = 'increasing'
-    elif change_percent < -5:
-        trend = 'decreasing'
-    else:
-        trend = 'stable'
-    
-    return {
-        'trend': trend,
-        'change_percent': float(change_percent),
-        'total_change': float(total_change)
-    }
+
+    first_revenue, last_revenue = endpoints
+    return _trend_result(first_revenue, last_revenue)
 
 
 def profit_trend(df):
@@ -76,52 +108,25 @@ def profit_trend(df):
     if df is None or df.empty:
         return {'trend': 'stable', 'change_percent': 0.0, 'total_change': 0.0}
     
-    # Check if profit column exists
+    # Profit as a bare array: derived from revenue - cost when the
+    # column is missing, with no frame copy either way
     if 'profit' in df.columns:
-        profit_col = 'profit'
+        profit = df['profit'].to_numpy()
     elif 'revenue' in df.columns and 'cost' in df.columns:
-        # Calculate profit if not present
-        df = df.copy()
-        df['profit'] = df['revenue'] - df['cost']
-        profit_col = 'profit'
+        profit = df['revenue'].to_numpy() - df['cost'].to_numpy()
     else:
         return {'trend': 'stable', 'change_percent': 0.0, 'total_change': 0.0}
-    
+
     if 'date' not in df.columns:
         return {'trend': 'stable', 'change_percent': 0.0, 'total_change': 0.0}
-    
-    # Sort by date and group by date
-    df_sorted = df.sort_values('date')
-    daily_profit = df_sorted.groupby('date')[profit_col].sum().reset_index()
-    
-    if len(daily_profit) < 2:
+
+    # Only the first- and last-day totals matter here
+    endpoints = _endpoint_sums(df['date'].to_numpy(), profit)
+    if endpoints is None:
         return {'trend': 'stable', 'change_percent': 0.0, 'total_change': 0.0}
-    
-    # Get first and last profit values
-    first_profit = daily_profit[profit_col].iloc[0]
-    last_profit = daily_profit[profit_col].iloc[-1]
-    
-    # Calculate change
-    total_change = last_profit - first_profit
-    
-    if first_profit == 0:
-        change_percent = 0.0
-    else:
-        change_percent = (total_change / abs(first_profit)) * 100
-    
-    # Determine trend
-    if change_percent > 5:
-        trend = 'increasing'
-    elif change_percent < -5:
-        trend = 'decreasing'
-    else:
-        trend = 'stable'
-    
-    return {
-        'trend': trend,
-        'change_percent': float(change_percent),
-        'total_change': float(total_change)
-    }
+
+    first_profit, last_profit = endpoints
+    return _trend_result(first_profit, last_profit, use_abs_base=True)
 
 
 def growth_rate(df, period='overall'):
@@ -142,25 +147,28 @@ def growth_rate(df, period='overall'):
     if not all(col in df.columns for col in required_cols):
         return 0.0
     
-    # Sort by date and group by date
-    df_sorted = df.sort_values('date')
-    daily_revenue = df_sorted.groupby('date')['revenue'].sum().reset_index()
-    
-    if len(daily_revenue) < 2:
-        return 0.0
-    
     if period == 'overall':
-        # Overall growth from first to last
-        first_revenue = daily_revenue['revenue'].iloc[0]
-        last_revenue = daily_revenue['revenue'].iloc[-1]
-        
+        # Overall growth from first to last day: endpoint sums only
+        endpoints = _endpoint_sums(df['date'].to_numpy(), df['revenue'].to_numpy())
+        if endpoints is None:
+            return 0.0
+
+        first_revenue, last_revenue = endpoints
+
         if first_revenue == 0:
             return 0.0
-        
+
         growth = ((last_revenue - first_revenue) / first_revenue) * 100
         return float(growth)
-    
-    elif period == 'average':
+
+    # Sort by date and group by date
+    df_sorted = df.sort_values('date')
+    daily_revenue = df_sorted.groupby('date', sort=False)['revenue'].sum().reset_index()
+
+    if len(daily_revenue) < 2:
+        return 0.0
+
+    if period == 'average':
         # Average daily growth rate
         revenues = daily_revenue['revenue'].values
         growth_rates = []
@@ -200,55 +208,66 @@ def detect_consecutive_losses(df, threshold=3):
             'loss_periods': []
         }
     
-    # Check if profit column exists
+    # Profit as a Series keyed by the original index — derived when the
+    # column is missing — so no frame copy is ever taken.
     if 'profit' in df.columns:
-        df_copy = df.copy()
-        profit_col = 'profit'
+        profit_values = df['profit']
     elif 'revenue' in df.columns and 'cost' in df.columns:
-        df_copy = df.copy()
-        df_copy['profit'] = df_copy['revenue'] - df_copy['cost']
-        profit_col = 'profit'
+        profit_values = df['revenue'] - df['cost']
     else:
         return {
             'has_consecutive_losses': False,
             'max_consecutive_days': 0,
             'loss_periods': []
         }
-    
-    if 'date' not in df_copy.columns:
+
+    if 'date' not in df.columns:
         return {
             'has_consecutive_losses': False,
             'max_consecutive_days': 0,
             'loss_periods': []
         }
-    
-    # Sort by date and group by date
-    df_sorted = df_copy.sort_values('date')
-    daily_profit = df_sorted.groupby('date')[profit_col].sum().reset_index()
-    
-    # Find consecutive losses
+
+    # Group straight by the date column; sorted group keys give the
+    # chronological daily series without a sort_values pass first
+    daily_profit = profit_values.groupby(df['date']).sum()
+
+    return _losses_from_daily(daily_profit, threshold)
+
+
+def _losses_from_daily(daily_profit, threshold):
+    # Find consecutive losses in a chronological daily profit Series.
+    # Track streaks as (start, end) index pairs and slice the dates out
+    # once at the end — building and copying a date list inside the
+    # loop made long streaks quadratic.
+    profit = daily_profit.to_numpy()
+
     consecutive = 0
+    streak_start = 0
     max_consecutive = 0
-    loss_dates = []
-    current_streak_dates = []
-    
-    for idx, row in daily_profit.iterrows():
-        if row[profit_col] < 0:
+    qualifying = []
+
+    for i, p in enumerate(profit):
+        if p < 0:
+            if consecutive == 0:
+                streak_start = i
             consecutive += 1
-            current_streak_dates.append(str(row['date']))
-            max_consecutive = max(max_consecutive, consecutive)
+            if consecutive > max_consecutive:
+                max_consecutive = consecutive
         else:
             if consecutive >= threshold:
-                loss_dates.extend(current_streak_dates)
+                qualifying.append((streak_start, i))
             consecutive = 0
-            current_streak_dates = []
-    
+
     # Check last streak
     if consecutive >= threshold:
-        loss_dates.extend(current_streak_dates)
-    
+        qualifying.append((streak_start, len(profit)))
+
+    dates = daily_profit.index
+    loss_dates = [str(d) for start, end in qualifying for d in dates[start:end]]
+
     has_losses = max_consecutive >= threshold
-    
+
     return {
         'has_consecutive_losses': has_losses,
         'max_consecutive_days': int(max_consecutive),
@@ -274,28 +293,45 @@ def product_trend_ranking(df):
     if not all(col in df.columns for col in required_cols):
         return []
     
-    products = df['product_name'].unique()
-    rankings = []
-    
-    for product in products:
-        product_df = df[df['product_name'] == product].copy()
-        
-        # Sort by date
-        product_df = product_df.sort_values('date')
-        daily_revenue = product_df.groupby('date')['revenue'].sum().reset_index()
-        
-        if len(daily_revenue) < 2:
+    # One grouped pass over (product, date) replaces the per-product
+    # filter-copy-sort loop: K boolean scans and frame copies collapse
+    # into a single hashed aggregation, and each product's first and
+    # last daily totals fall out of the segment boundaries.
+    daily = df.groupby(['product_name', 'date'], sort=True, observed=True)['revenue'].sum()
+
+    if daily.empty:
+        return []
+
+    prods = daily.index.get_level_values(0).to_numpy()
+    values = daily.to_numpy()
+
+    change = np.flatnonzero(prods[1:] != prods[:-1])
+    starts = np.concatenate(([0], change + 1))
+    ends = np.concatenate((change, [len(prods) - 1]))
+
+    growth_by_product = {}
+    for s, e in zip(starts, ends):
+        # Products seen on a single date carry no trend
+        if e == s:
             continue
-        
-        # Calculate growth rate for this product
-        first_rev = daily_revenue['revenue'].iloc[0]
-        last_rev = daily_revenue['revenue'].iloc[-1]
-        
+
+        first_rev = values[s]
+        last_rev = values[e]
+
         if first_rev == 0:
-            growth = 0.0
+            growth_by_product[prods[s]] = 0.0
         else:
-            growth = ((last_rev - first_rev) / first_rev) * 100
-        
+            growth_by_product[prods[s]] = float(((last_rev - first_rev) / first_rev) * 100)
+
+    # Emit in first-appearance order so equal growth rates keep their
+    # original relative order through the stable sort below
+    rankings = []
+    for product in pd.unique(df['product_name']):
+        if product not in growth_by_product:
+            continue
+
+        growth = growth_by_product[product]
+
         # Determine trend
         if growth > 5:
             trend = 'growing'
@@ -303,16 +339,16 @@ def product_trend_ranking(df):
             trend = 'declining'
         else:
             trend = 'stable'
-        
+
         rankings.append({
             'product': product,
-            'growth_rate': float(growth),
+            'growth_rate': growth,
             'trend': trend
         })
-    
+
     # Sort by growth rate (highest first)
     rankings.sort(key=lambda x: x['growth_rate'], reverse=True)
-    
+
     return rankings
 
 
@@ -320,18 +356,77 @@ def get_all_trends(df):
     """
     Get all trend analysis results in one dictionary.
     Useful for generating comprehensive trend reports.
-    
+
     Args:
         df (DataFrame): Business data
-        
+
     Returns:
         dict: All trend analysis results
     """
+    cols = set(df.columns) if df is not None and not df.empty else set()
+    has_profit_source = 'profit' in cols or {'revenue', 'cost'} <= cols
+
+    if 'date' not in cols or 'revenue' not in cols or not has_profit_source:
+        # Degraded frames go through each function's own guards
+        return {
+            'revenue_trend': revenue_trend(df),
+            'profit_trend': profit_trend(df),
+            'overall_growth_rate': growth_rate(df, 'overall'),
+            'average_growth_rate': growth_rate(df, 'average'),
+            'consecutive_losses': detect_consecutive_losses(df),
+            'product_rankings': product_trend_ranking(df)
+        }
+
+    # Fused path: extract the columns once and build both daily series
+    # in a single grouping pass, instead of each sub-result re-walking
+    # and re-aggregating the frame.
+    dates = df['date'].to_numpy()
+    revenue = df['revenue'].to_numpy()
+
+    if 'profit' in cols:
+        profit = df['profit'].to_numpy()
+    else:
+        profit = revenue - df['cost'].to_numpy()
+
+    daily = pd.DataFrame({'revenue': revenue, 'profit': profit}).groupby(dates).sum()
+
+    if len(daily) < 2:
+        stable = {'trend': 'stable', 'change_percent': 0.0, 'total_change': 0.0}
+        return {
+            'revenue_trend': dict(stable),
+            'profit_trend': dict(stable),
+            'overall_growth_rate': 0.0,
+            'average_growth_rate': 0.0,
+            'consecutive_losses': _losses_from_daily(daily['profit'], 3),
+            'product_rankings': product_trend_ranking(df)
+        }
+
+    daily_revenue = daily['revenue'].to_numpy()
+    daily_profit = daily['profit'].to_numpy()
+
+    first_revenue = float(daily_revenue[0])
+    last_revenue = float(daily_revenue[-1])
+
+    if first_revenue == 0:
+        overall = 0.0
+    else:
+        overall = float(((last_revenue - first_revenue) / first_revenue) * 100)
+
+    # Average daily growth, same semantics as growth_rate('average')
+    # but as one masked vector op over the daily series
+    prev = daily_revenue[:-1]
+    nxt = daily_revenue[1:]
+    mask = prev != 0
+    if mask.any():
+        average = float(np.mean(((nxt[mask] - prev[mask]) / prev[mask]) * 100))
+    else:
+        average = 0.0
+
     return {
-        'revenue_trend': revenue_trend(df),
-        'profit_trend': profit_trend(df),
-        'overall_growth_rate': growth_rate(df, 'overall'),
-        'average_growth_rate': growth_rate(df, 'average'),
-        'consecutive_losses': detect_consecutive_losses(df),
+        'revenue_trend': _trend_result(first_revenue, last_revenue),
+        'profit_trend': _trend_result(float(daily_profit[0]), float(daily_profit[-1]), use_abs_base=True),
+        'overall_growth_rate': overall,
+        'average_growth_rate': average,
+        'consecutive_losses': _losses_from_daily(daily['profit'], 3),
         'product_rankings': product_trend_ranking(df)
     }
\ No newline at end of file
@@ -9,6 +9,7 @@ import streamlit as st
 import pandas as pd
 import time
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from streamlit_lottie import st_lottie
 
 def reset_app():
@@ -33,17 +34,26 @@ def reset_app():
 
 
 def save_charts_to_images(df):
-    charts = {
-        "revenue.png": revenue_trend_chart(df),
-        "profit.png": profit_by_product_chart(df),
-        "pie.png": revenue_contribution_pie(df)
+    builders = {
+        "revenue.png": revenue_trend_chart,
+        "profit.png": profit_by_product_chart,
+        "pie.png": revenue_contribution_pie
     }
 
-    images = {}
-    for name, fig in charts.items():
-        images[name] = fig.to_image(format="png")
+    # PNG encoding dominates here; running the three build+encode jobs
+    # on a small thread pool lets one chart's figure construction
+    # overlap another's encode instead of serializing everything.
+    # Pinning the kaleido engine skips plotly's renderer auto-detection,
+    # and the explicit 800px width matches what the PDF builder embeds
+    # so it never has to downscale the images afterwards.
+    def render(builder):
+        return builder(df).to_image(format="png", engine="kaleido",
+                                    width=800, height=450)
 
-    return images
+    with ThreadPoolExecutor(max_workers=len(builders)) as pool:
+        futures = {name: pool.submit(render, builder)
+                   for name, builder in builders.items()}
+        return {name: future.result() for name, future in futures.items()}
 
 
 # ------------------ Page Config ------------------
@@ -336,7 +346,11 @@ if not st.session_state.data_loaded:
             raw = load_data(uploaded_file)
             mapped = map_to_internal_schema(raw)
             df = validate_dataframe(mapped)
-            df["profit"] = df["revenue"] - df["cost"]
+            # The mapper already derives profit and the validator
+            # coerces it; only recompute for frames that somehow
+            # arrive without the column.
+            if "profit" not in df.columns:
+                df["profit"] = df["revenue"].to_numpy() - df["cost"].to_numpy()
             st.session_state.df = df
             st.session_state.data_loaded = True
             st.success("System Ready 🚀")
@@ -0,0 +1,26 @@
+import os
+from functools import lru_cache
+from types import SimpleNamespace
+
+try:
+    from dotenv import load_dotenv
+except ImportError:
+    load_dotenv = None
+
+
+@lru_cache(maxsize=1)
+def get_settings():
+    """
+    Load .env exactly once per process and expose API keys as attributes.
+
+    Import-time load_dotenv() calls in hot modules re-read and re-parse
+    the file on every fresh worker boot; routing through this cached
+    helper keeps that cost to a single call.
+    """
+    if load_dotenv is not None:
+        load_dotenv()
+
+    return SimpleNamespace(
+        gemini_key=os.getenv("GEMINI_API_KEY"),
+        groq_key=os.getenv("GROQ_API_KEY"),
+    )
@@ -1,18 +1,62 @@
+import os
+
 import pandas as pd
 
+# Uploads past this size go through pyarrow's own block reader, which
+# streams the file in bounded chunks instead of buffering it all.
+_LARGE_FILE_BYTES = 256 * 1024 * 1024
+
+
 def load_data(file):
     try:
         if file is None:
             raise ValueError("No file uploaded")
 
-        if file.size == 0:
+        # Streamlit upload objects carry .size and a cursor that must
+        # be rewound between read attempts; path call sites (main.py,
+        # the test scripts) stat the file instead and have no cursor.
+        is_upload = hasattr(file, "size")
+        size = file.size if is_upload else os.path.getsize(file)
+
+        if size == 0:
             raise ValueError("Uploaded file is empty")
 
         # 🔥 THIS LINE GOES HERE (before read_csv)
-        file.seek(0)
+        if is_upload:
+            file.seek(0)
+
+        df = None
+
+        # Very large uploads: read through pyarrow's csv module
+        # directly so the file streams in 16MB blocks across threads
+        # rather than being buffered whole before parsing.
+        if size > _LARGE_FILE_BYTES:
+            try:
+                from pyarrow import csv as pacsv
+                df = pacsv.read_csv(
+                    file,
+                    read_options=pacsv.ReadOptions(use_threads=True, block_size=1 << 24),
+                ).to_pandas()
+            except Exception:
+                if is_upload:
+                    file.seek(0)
+                df = None
 
         # 🔥 Robust CSV read
-        df = pd.read_csv(file, sep=None, engine="python")
+        # Fast path first: pyarrow's multithreaded columnar reader is
+        # far quicker than the sniffing python engine but only handles
+        # comma-delimited files. If it is missing, rejects the file, or
+        # everything landed in one column (wrong delimiter), fall back
+        # to the sniffing read below.
+        if df is None:
+            try:
+                df = pd.read_csv(file, engine="pyarrow")
+                if df.shape[1] == 1 and any(d in str(df.columns[0]) for d in (';', '\t', '|')):
+                    raise ValueError("delimiter not detected")
+            except Exception:
+                if is_upload:
+                    file.seek(0)
+                df = pd.read_csv(file, sep=None, engine="python")
 
         if df.empty:
             raise ValueError("CSV has no data")
@@ -1,12 +1,26 @@
 import pandas as pd
 
+
+def _parse_dates(col):
+    # Columns that arrived already parsed (e.g. from the pyarrow CSV
+    # engine) skip re-parsing entirely. String columns try the strict
+    # C-level ISO8601 path first — with cache=True repeated dates parse
+    # once — and fall back to full inference for other formats.
+    if pd.api.types.is_datetime64_any_dtype(col):
+        return col
+    try:
+        return pd.to_datetime(col, format="ISO8601", cache=True)
+    except (TypeError, ValueError):
+        return pd.to_datetime(col, errors="coerce", cache=True)
+
+
 def map_to_internal_schema(df: pd.DataFrame) -> pd.DataFrame:
     df = df.copy()
 
     # Date
     for col in ["date", "order_date", "invoice_date"]:
         if col in df.columns:
-            df["date"] = pd.to_datetime(df[col], errors="coerce")
+            df["date"] = _parse_dates(df[col])
             break
     else:
         df["date"] = pd.NaT
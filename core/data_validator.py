@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 
 REQUIRED_COLUMNS = [
@@ -9,7 +10,7 @@ REQUIRED_COLUMNS = [
     "profit",
 ]
 
-def validate_dataframe(df: pd.DataFrame) -> pd.DataFrame:
+def validate_dataframe(df: pd.DataFrame, precision=None) -> pd.DataFrame:
     missing = [col for col in REQUIRED_COLUMNS if col not in df.columns]
     if missing:
         raise ValueError(f"Missing internal columns: {missing}")
@@ -20,7 +21,22 @@ def validate_dataframe(df: pd.DataFrame) -> pd.DataFrame:
     df["cost"] = pd.to_numeric(df["cost"], errors="coerce").fillna(0)
     df["profit"] = pd.to_numeric(df["profit"], errors="coerce").fillna(0)
 
+    # Optional storage downcast: float32 halves the bytes every
+    # downstream reduction streams, and its ~7 significant digits keep
+    # cent precision for amounts into the tens of millions. Totals over
+    # bigger books should stay on the default float64.
+    if precision == "float32":
+        for col in ("revenue", "cost", "profit"):
+            df[col] = df[col].astype(np.float32)
+
     if "date" in df.columns:
         df["date"] = pd.to_datetime(df["date"], errors="coerce")
 
+        # Hand every consumer a chronologically sorted frame: the risk
+        # and trend paths check date monotonicity and skip their own
+        # argsort when it holds, so paying one stable sort here (only
+        # when actually needed) saves a sort per downstream call.
+        if not df["date"].is_monotonic_increasing:
+            df = df.sort_values("date", kind="stable", ignore_index=True)
+
     return df
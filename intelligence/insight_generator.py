@@ -1,15 +1,126 @@
+import itertools
+import json
+import random
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+import httpx
 import streamlit as st
-from groq import Groq
+from groq import APIConnectionError, Groq, InternalServerError, RateLimitError
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
 
 # --------------------------------------------------
 # GROQ SETUP (STREAMLIT CLOUD SAFE)
 # --------------------------------------------------
 
-client = Groq(api_key=st.secrets["GROQ_API_KEY"])
+@lru_cache(maxsize=1)
+def _deps():
+    # One-time import of the pandas-heavy analysis modules. Kept lazy so
+    # importing this module stays cheap, but cached so hot calls pay a
+    # single tuple unpack instead of repeated import machinery.
+    from analysis.analyzer import get_all_metrics
+    from analysis.trends import get_all_trends
+    from intelligence.risk_detector import get_all_risks
+    return get_all_metrics, get_all_trends, get_all_risks
+
+
+# Bounded cache for per-DataFrame analysis results, so switching focus
+# areas on the same upload does not re-run the aggregation passes.
+_ANALYSIS_CACHE = {}
+_ANALYSIS_CACHE_SIZE = 8
+
+
+def _df_fingerprint(df):
+    # Cheap identity proxy: row count, date endpoints, revenue and cost
+    # totals. Both money columns matter — a cost-only what-if keeps the
+    # same dates and revenue, and must not collide with the original.
+    # Returns None (= uncacheable) when the frame lacks those columns.
+    try:
+        return (
+            len(df),
+            str(df['date'].iloc[0]),
+            str(df['date'].iloc[-1]),
+            float(df['revenue'].sum()),
+            float(df['cost'].sum()),
+        )
+    except (KeyError, IndexError):
+        return None
+
+
+def _analyze(df):
+    """Return (metrics, trends, risks) for df, memoized on a fingerprint."""
+    key = _df_fingerprint(df)
+    if key is not None and key in _ANALYSIS_CACHE:
+        return _ANALYSIS_CACHE[key]
+
+    get_all_metrics, get_all_trends, get_all_risks = _deps()
+    result = (get_all_metrics(df), get_all_trends(df), get_all_risks(df))
+
+    if key is not None:
+        if len(_ANALYSIS_CACHE) >= _ANALYSIS_CACHE_SIZE:
+            _ANALYSIS_CACHE.pop(next(iter(_ANALYSIS_CACHE)))
+        _ANALYSIS_CACHE[key] = result
+
+    return result
+
+
+def _pooled_http_client():
+    # Keep-alive pooling so repeated insight calls reuse one TLS
+    # connection instead of handshaking per request. HTTP/2 needs the
+    # optional h2 package, so fall back to HTTP/1.1 without it.
+    limits = httpx.Limits(max_keepalive_connections=20, max_connections=40)
+    try:
+        return httpx.Client(http2=True, limits=limits)
+    except ImportError:
+        return httpx.Client(limits=limits)
+
+
+client = Groq(api_key=st.secrets["GROQ_API_KEY"], http_client=_pooled_http_client())
 AI_AVAILABLE = True
 
 MODEL_NAME = "llama-3.1-8b-instant"
 
+# When True the insight calls request Groq's JSON mode
+# (response_format=json_object, decoded by the fast path in
+# _parse_ai_response) and the ~150-token FORMAT block is dropped from
+# every prompt, cutting prefill tokens and cost per call. Toggled from
+# secrets.toml so deployments can opt in without a code edit.
+USE_JSON_MODE = bool(st.secrets.get("GROQ_JSON_MODE", False))
+
+# Retry budget for transient API failures. Only these error classes
+# are worth a second attempt — timeouts/connection drops (timeout is a
+# subclass of the connection error), 429s and 5xx. Bad requests, auth
+# failures and oversized prompts fail identically every time and are
+# raised immediately.
+_MAX_ATTEMPTS = 3
+_RETRYABLE_ERRORS = (APIConnectionError, RateLimitError, InternalServerError)
+
+# Section headers and bullets, compiled once. Scanning for headers and
+# slicing the text between them avoids per-line .upper() copies and the
+# line-by-line state machine entirely.
+_HEADER_RE = re.compile(r"(?im)^\s*(INSIGHTS|KEY POINTS|RECOMMENDATIONS)\s*:\s*(.*)$")
+_BULLET_RE = re.compile(r"(?m)^\s*[-•]\s*(.+)$")
+
+# Safety screening patterns, combined so each concern is one linear
+# scan of the response instead of a loop of substring tests.
+_BAD_RE = re.compile(r"\b(hack|illegal|fraud|scam)\b", re.IGNORECASE)
+_BIZ_RE = re.compile(r"\b(revenue|profit|cost|business|product|sales)\b", re.IGNORECASE)
+
+# Static pieces of the rule-based fallback, built once instead of per call.
+_FALLBACK_INSIGHTS = "AI insights unavailable. Showing rule-based analysis only."
+_FALLBACK_RECS = (
+    "Review pricing strategy",
+    "Optimize inventory levels",
+    "Focus on high-performing products"
+)
+
 # --------------------------------------------------
 # BUSINESS INSIGHTS
 # --------------------------------------------------
@@ -25,68 +136,186 @@ def generate_business_insights(df, focus_area="overall", model_key=None):
         }
 
     try:
-        from analysis.analyzer import get_all_metrics
-        from analysis.trends import get_all_trends
-        from intelligence.risk_detector import get_all_risks
+        # --------- NO AI FALLBACK ----------
+        # Checked first: the fallback only reads the risk summary, so
+        # skip the metrics/trends passes (and the prompt build) entirely.
+        if not AI_AVAILABLE:
+            risks = _deps()[2](df)
+            return {
+                "success": True,
+                "insights": _FALLBACK_INSIGHTS,
+                "key_points": list(itertools.islice(risks["summary"].values(), 3)),
+                "recommendations": _FALLBACK_RECS,
+                "error": None
+            }
 
-        metrics = get_all_metrics(df)
-        trends = get_all_trends(df)
-        risks = get_all_risks(df)
+        metrics, trends, risks = _analyze(df)
 
         summary = _prepare_data_summary(metrics, trends, risks)
+        prompt = _build_insights_prompt(summary, json_mode=USE_JSON_MODE)
+
+        # Blocking path = stream joined back together, so both paths
+        # share one request shape. Groq's JSON mode is incompatible
+        # with streaming, so it requests the whole body at once instead.
+        if USE_JSON_MODE:
+            text = _completion_text(prompt)
+        else:
+            text = "".join(_stream_completion(prompt))
+
+        safety = validate_ai_safety(text)
+        if not safety["is_safe"]:
+            return {
+                "success": False,
+                "insights": "",
+                "key_points": [],
+                "recommendations": [],
+                "error": "Response failed safety check: " + ", ".join(safety["flagged_terms"])
+            }
 
-        # --------- NO AI FALLBACK ----------
-        if not AI_AVAILABLE:
+        parsed = _parse_ai_response(text)
+
+        return {
+            "success": True,
+            "insights": parsed["insights"],
+            "key_points": parsed["key_points"],
+            "recommendations": parsed["recommendations"],
+            "error": None
+        }
+
+    except Exception as e:
+        msg = str(e)
+
+        return {
+            "success": False,
+            "insights": "",
+            "key_points": [],
+            "recommendations": [],
+            "error": msg
+        }
+
+
+# --------------------------------------------------
+# BATCH INSIGHTS
+# --------------------------------------------------
+
+def generate_insights_batch(df, focus_areas):
+    """
+    Generate insights for several focus areas in one pass.
+
+    The per-frame analysis (metrics, trends, risks) is computed once and
+    shared by every prompt, and the prompts are issued concurrently over
+    the pooled client. Groq has no batch endpoint, so concurrent fan-out
+    over keep-alive connections is the closest equivalent. Returns
+    {focus_area: result dict} in the generate_business_insights shape.
+    """
+    if df is None or df.empty:
+        return {
+            area: {
+                "success": False,
+                "insights": "",
+                "key_points": [],
+                "recommendations": [],
+                "error": "No data provided"
+            }
+            for area in focus_areas
+        }
+
+    metrics, trends, risks = _analyze(df)
+
+    summary = _prepare_data_summary(metrics, trends, risks)
+    base_prompt = _build_insights_prompt(summary, json_mode=USE_JSON_MODE)
+
+    def _one(area):
+        prompt = base_prompt
+        if area != "overall":
+            prompt = f"FOCUS AREA: {area}\n{base_prompt}"
+
+        try:
+            if USE_JSON_MODE:
+                text = _completion_text(prompt)
+            else:
+                text = "".join(_stream_completion(prompt))
+            parsed = _parse_ai_response(text)
             return {
                 "success": True,
-                "insights": "AI insights unavailable. Showing rule-based analysis only.",
-                "key_points": list(risks["summary"].values())[:3],
-                "recommendations": [
-                    "Review pricing strategy",
-                    "Optimize inventory levels",
-                    "Focus on high-performing products"
-                ],
+                "insights": parsed["insights"],
+                "key_points": parsed["key_points"],
+                "recommendations": parsed["recommendations"],
                 "error": None
             }
+        except Exception as e:
+            return {
+                "success": False,
+                "insights": "",
+                "key_points": [],
+                "recommendations": [],
+                "error": str(e)
+            }
 
-        prompt = f"""
-You are a business analyst AI.
+    with ThreadPoolExecutor(max_workers=min(4, len(focus_areas))) as pool:
+        results = list(pool.map(_one, focus_areas))
 
-Analyze the data below and respond in EXACTLY this format.
-Do NOT add extra text.
+    return dict(zip(focus_areas, results))
 
-DATA:
-{summary}
 
-FORMAT:
+# --------------------------------------------------
+# STREAMING INSIGHTS
+# --------------------------------------------------
 
-INSIGHTS:
-<one paragraph>
+def stream_business_insights(df, focus_area="overall", model_key=None):
+    """
+    Generator variant of generate_business_insights.
 
-KEY POINTS:
-- Point 1
-- Point 2
-- Point 3
+    Yields {"insights_partial": <text so far>} dicts as tokens arrive
+    (feed directly to st.write_stream), then one final dict in the
+    same shape generate_business_insights returns.
 
-RECOMMENDATIONS:
-- Recommendation 1
-- Recommendation 2
-- Recommendation 3
-"""
+    Always plain text: Groq's JSON mode is incompatible with
+    streaming, so this path ignores USE_JSON_MODE and keeps the
+    labeled-sections prompt.
+    """
+    if df is None or df.empty:
+        yield {
+            "success": False,
+            "insights": "",
+            "key_points": [],
+            "recommendations": [],
+            "error": "No data provided"
+        }
+        return
 
-        response = client.chat.completions.create(
-            model=MODEL_NAME,
-            messages=[
-                {"role": "system", "content": "You are a professional business intelligence assistant."},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.4,
-        )
+    try:
+        metrics, trends, risks = _analyze(df)
+
+        summary = _prepare_data_summary(metrics, trends, risks)
+        prompt = _build_insights_prompt(summary)
+
+        parts = []
+        text = ""
+        for chunk in _stream_completion(prompt):
+            parts.append(chunk)
+            text = "".join(parts)
+            # Screen before every yield: partials must not leak text
+            # the blocking path would refuse, so stop streaming the
+            # moment a flagged term appears.
+            if _BAD_RE.search(text):
+                break
+            yield {"insights_partial": text}
+
+        safety = validate_ai_safety(text)
+        if not safety["is_safe"]:
+            yield {
+                "success": False,
+                "insights": "",
+                "key_points": [],
+                "recommendations": [],
+                "error": "Response failed safety check: " + ", ".join(safety["flagged_terms"])
+            }
+            return
 
-        text = response.choices[0].message.content
         parsed = _parse_ai_response(text)
 
-        return {
+        yield {
             "success": True,
             "insights": parsed["insights"],
             "key_points": parsed["key_points"],
@@ -95,29 +324,116 @@ RECOMMENDATIONS:
         }
 
     except Exception as e:
-        msg = str(e)
-
-        return {
+        yield {
             "success": False,
             "insights": "",
             "key_points": [],
             "recommendations": [],
-            "error": msg
+            "error": str(e)
         }
 
 
+def _create_completion(messages, temperature, stream=False, json_mode=False):
+    """
+    Create a chat completion with retry + jittered exponential backoff.
+
+    Transient failures (5xx, timeouts, rate limits) used to surface as
+    an empty dashboard; retry those up to _MAX_ATTEMPTS times before
+    giving up. Everything else — including quota exhaustion, which
+    arrives as a rate-limit error but is not transient — is raised
+    immediately.
+
+    json_mode constrains the response to a JSON object at the API
+    level; only the insight prompts opt in — the quick-summary and
+    dashboard prompts expect labeled plain text.
+    """
+    extra = {"response_format": {"type": "json_object"}} if json_mode else {}
+    delay = 0.5
+    for attempt in range(_MAX_ATTEMPTS):
+        try:
+            return client.chat.completions.create(
+                model=MODEL_NAME,
+                messages=messages,
+                temperature=temperature,
+                stream=stream,
+                **extra,
+            )
+        except _RETRYABLE_ERRORS as e:
+            msg = str(e).lower()
+            if "quota" in msg or "resource_exhausted" in msg:
+                raise
+            if attempt == _MAX_ATTEMPTS - 1:
+                raise
+            time.sleep(delay + random.uniform(0, delay))
+            delay = min(delay * 2, 4.0)
+
+
+def _completion_text(prompt):
+    """
+    Full response text for prompt in one blocking JSON-mode call.
+
+    Groq rejects response_format={"type": "json_object"} on streaming
+    requests, so the blocking insight paths use this instead of
+    joining chunks when USE_JSON_MODE is on.
+    """
+    response = _create_completion(
+        messages=[
+            {"role": "system", "content": "You are a professional business intelligence assistant."},
+            {"role": "user", "content": prompt}
+        ],
+        temperature=0.4,
+        json_mode=True,
+    )
+    return response.choices[0].message.content
+
+
+def _stream_completion(prompt):
+    """Yield text chunks from a streaming Groq completion."""
+    response = _create_completion(
+        messages=[
+            {"role": "system", "content": "You are a professional business intelligence assistant."},
+            {"role": "user", "content": prompt}
+        ],
+        temperature=0.4,
+        stream=True,
+    )
+
+    for chunk in response:
+        delta = chunk.choices[0].delta.content
+        if delta:
+            yield delta
+
+
 # --------------------------------------------------
 # QUICK SUMMARY
 # --------------------------------------------------
 
+def _template_summary(metrics):
+    # Deterministic summary for data the model could only restate.
+    if metrics['total_revenue'] == 0:
+        return "No revenue recorded yet, so there is no performance to summarize."
+
+    return (
+        f"The business generated ₹{metrics['total_revenue']:,.2f} in revenue with a "
+        f"profit of ₹{metrics['total_profit']:,.2f} ({metrics['profit_margin']:.1f}% margin). "
+        f"Costs totalled ₹{metrics['total_cost']:,.2f}."
+    )
+
+
 def generate_quick_summary(df, model_key=None):
     if df is None or df.empty:
         return {"success": False, "summary": "", "error": "No data"}
 
     try:
-        from analysis.analyzer import get_all_metrics
+        get_all_metrics = _deps()[0]
         metrics = get_all_metrics(df)
 
+        # Trivially describable data (no revenue, or a single product)
+        # gets a local template summary: instant, and skips a network
+        # round-trip that dominates this function's latency.
+        if metrics['total_revenue'] == 0 or len(metrics['product_summary']) <= 1:
+            return {"success": True, "summary": _template_summary(metrics), "error": None}
+
         prompt = f"""
 Summarize the business performance in 2 sentences.
 
@@ -127,8 +443,7 @@ Profit: {metrics['total_profit']}
 Margin: {metrics['profit_margin']}%
 """
 
-        response = client.chat.completions.create(
-            model=MODEL_NAME,
+        response = _create_completion(
             messages=[{"role": "user", "content": prompt}],
             temperature=0.3,
         )
@@ -146,53 +461,194 @@ Margin: {metrics['profit_margin']}%
             "error": str(e)
         }
 
+# --------------------------------------------------
+# DASHBOARD BUNDLE
+# --------------------------------------------------
+
+_BUNDLE_HEADER_RE = re.compile(r"(?im)^\s*(SUMMARY|INSIGHTS|PRODUCT_INSIGHTS)\s*:\s*(.*)$")
+
+
+def generate_dashboard_bundle(df, focus_areas=("overall", "products")):
+    """
+    Fetch every dashboard section in a single API call.
+
+    Dashboards typically render the quick summary, the overall insights
+    and the product breakdown together; requesting them as labeled
+    sections of one prompt costs one round-trip and one copy of the
+    shared data summary instead of three. Returns a dict with 'summary',
+    'insights' and 'product_insights' keys split client-side.
+    """
+    if df is None or df.empty:
+        return {
+            "success": False,
+            "summary": "",
+            "insights": "",
+            "product_insights": "",
+            "error": "No data provided"
+        }
+
+    try:
+        metrics, trends, risks = _analyze(df)
+        data_summary = _prepare_data_summary(metrics, trends, risks)
+
+        sections_wanted = ["SUMMARY:\n<two sentences on overall performance>"]
+        if "overall" in focus_areas:
+            sections_wanted.append("INSIGHTS:\n<one paragraph of business insights>")
+        if "products" in focus_areas:
+            sections_wanted.append("PRODUCT_INSIGHTS:\n<one paragraph on product performance>")
+
+        prompt = (
+            "Analyze the business data below and respond in EXACTLY this format, "
+            "with each section on its own lines. Do NOT add extra text.\n\n"
+            "DATA:\n" + data_summary + "\nFORMAT:\n\n" + "\n\n".join(sections_wanted)
+        )
+
+        response = _create_completion(
+            messages=[
+                {"role": "system", "content": "You are a professional business intelligence assistant."},
+                {"role": "user", "content": prompt}
+            ],
+            temperature=0.4,
+        )
+        text = response.choices[0].message.content
+
+        sections = {}
+        headers = list(_BUNDLE_HEADER_RE.finditer(text))
+        for i, m in enumerate(headers):
+            end = headers[i + 1].start() if i + 1 < len(headers) else len(text)
+            sections[m.group(1).upper()] = (m.group(2) + text[m.end():end]).strip()
+
+        return {
+            "success": True,
+            "summary": sections.get("SUMMARY", ""),
+            "insights": sections.get("INSIGHTS", ""),
+            "product_insights": sections.get("PRODUCT_INSIGHTS", ""),
+            "error": None
+        }
+
+    except Exception as e:
+        return {
+            "success": False,
+            "summary": "",
+            "insights": "",
+            "product_insights": "",
+            "error": str(e)
+        }
+
+
 # --------------------------------------------------
 # HELPERS (UNCHANGED)
 # --------------------------------------------------
 
-def _prepare_data_summary(metrics, trends, risks):
+def _build_insights_prompt(summary, json_mode=False):
+    if json_mode:
+        return (
+            'Analyze the business data below. Answer as JSON with keys '
+            '"insights" (string), "key_points" and "recommendations" '
+            '(lists of 3 strings).\n\nDATA:\n' + summary
+        )
+
     return f"""
+You are a business analyst AI.
+
+Analyze the data below and respond in EXACTLY this format.
+Do NOT add extra text.
+
+DATA:
+{summary}
+
+FORMAT:
+
+INSIGHTS:
+<one paragraph>
+
+KEY POINTS:
+- Point 1
+- Point 2
+- Point 3
+
+RECOMMENDATIONS:
+- Recommendation 1
+- Recommendation 2
+- Recommendation 3
+"""
+
+
+def _prepare_data_summary(metrics, trends, risks):
+    # Built as a parts list joined once: appending product lines with
+    # `summary += ...` would be quadratic for catalogs with many SKUs.
+    parts = [f"""
 Revenue: {metrics['total_revenue']}
 Cost: {metrics['total_cost']}
 Profit: {metrics['total_profit']}
 Margin: {metrics['profit_margin']}%
 
+Products:
+"""]
+
+    parts.extend(
+        f"{p}: Revenue={d['revenue']:,.2f}, Profit={d['profit']:,.2f}, Margin={d['margin']:.1f}%\n"
+        for p, d in metrics['product_summary'].items()
+    )
+
+    parts.append(f"""
 Revenue Trend: {trends['revenue_trend']['trend']}
 Profit Trend: {trends['profit_trend']['trend']}
 
 Risk Level: {risks['summary']['overall_risk_level']}
-"""
+""")
+
+    return "".join(parts)
+
+def validate_ai_safety(insights_text):
+    """Screen generated text for unsafe terms and business relevance."""
+    flagged = _BAD_RE.findall(insights_text)
+    return {
+        "is_safe": not flagged,
+        "flagged_terms": [t.lower() for t in flagged],
+        "is_business_related": bool(_BIZ_RE.search(insights_text)),
+    }
+
 
 def _parse_ai_response(text):
+    # Fast path: if the model answered with JSON, decode it directly
+    # (orjson when available) instead of walking lines.
+    stripped = text.strip()
+    if stripped.startswith("{"):
+        try:
+            data = _loads(stripped)
+            return {
+                "insights": data.get("insights", "") or stripped,
+                "key_points": data.get("key_points") or ["No key points generated"],
+                "recommendations": data.get("recommendations") or ["No recommendations generated"]
+            }
+        except ValueError:
+            pass
+
+    # Locate the section headers in one compiled scan, then slice the
+    # text between consecutive headers. Bullets are pulled out of each
+    # slice with a second precompiled pattern, so no per-line .upper()
+    # copies or quadratic string appends.
+    headers = list(_HEADER_RE.finditer(text))
+
     insights = ""
     key_points = []
     recommendations = []
-    section = None
-
-    for line in text.splitlines():
-        l = line.strip()
-
-        if l.upper().startswith("INSIGHTS"):
-            section = "insights"
-            continue
-        if l.upper().startswith("KEY"):
-            section = "key"
-            continue
-        if l.upper().startswith("RECOMMEND"):
-            section = "rec"
-            continue
-
-        if section == "insights" and l:
-            insights += " " + l
 
-        elif section == "key" and l.startswith(("-", "•")):
-            key_points.append(l.lstrip("-• ").strip())
+    for i, m in enumerate(headers):
+        end = headers[i + 1].start() if i + 1 < len(headers) else len(text)
+        body = m.group(2) + text[m.end():end]
+        name = m.group(1).upper()
 
-        elif section == "rec" and l.startswith(("-", "•")):
-            recommendations.append(l.lstrip("-• ").strip())
+        if name == "INSIGHTS":
+            insights = " ".join(body.split())
+        elif name == "KEY POINTS":
+            key_points = [b.strip() for b in _BULLET_RE.findall(body)]
+        else:
+            recommendations = [b.strip() for b in _BULLET_RE.findall(body)]
 
     return {
-        "insights": insights.strip() or text.strip(),
+        "insights": insights or stripped,
         "key_points": key_points or ["No key points generated"],
         "recommendations": recommendations or ["No recommendations generated"]
     }
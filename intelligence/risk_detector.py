@@ -13,15 +13,178 @@ Required DataFrame columns: date, product_name, quantity, selling_price, revenue
 import pandas as pd
 import numpy as np
 
+try:
+    from numba import njit, vectorize
+    _HAVE_NUMBA = True
+except ImportError:
+    _HAVE_NUMBA = False
+
+
+if _HAVE_NUMBA:
+    @njit(cache=True)
+    def _scan_streak(profit):
+        """
+        Single fused pass over the daily profit array.
+
+        Returns (best_len, best_start, best_end, total_loss) so the
+        caller gets the longest loss streak and the summed losses
+        without the two N-sized temporaries the NumPy path allocates.
+        """
+        cur_len = 0
+        cur_start = 0
+        best_len = 0
+        best_start = 0
+        best_end = 0
+        total_loss = 0.0
+
+        for i in range(profit.shape[0]):
+            p = profit[i]
+            if p < 0.0:
+                if cur_len == 0:
+                    cur_start = i
+                cur_len += 1
+                total_loss += -p
+                if cur_len > best_len:
+                    best_len = cur_len
+                    best_start = cur_start
+                    best_end = i + 1
+            else:
+                cur_len = 0
+
+        return best_len, best_start, best_end, total_loss
+
+    @vectorize(['float64(float64, float64)', 'float32(float32, float32)'],
+               nopython=True)
+    def _margin_pct(num, denom):
+        """
+        Guarded percentage ufunc: (num / denom) * 100, +inf when denom
+        is zero. As a real ufunc it needs no mask array and no
+        pre-filled output buffer.
+        """
+        if denom != 0.0:
+            return (num / denom) * 100.0
+        return np.inf
+
+
+def _as_float_array(series):
+    # Null-bearing or hand-edited CSV columns can arrive as object
+    # dtype, which drops every reduction off the vectorized path.
+    # Coerce once to a contiguous float buffer at ingress, keeping NaN
+    # in place — callers zero-fill only after any derived columns are
+    # built, so a NaN revenue cell voids that row's profit (NaN - cost
+    # is NaN) exactly as the groupby's skipna did, instead of counting
+    # as a full-cost loss. Columns stored as float32
+    # (validate_dataframe's precision option) stay float32 so the scans
+    # keep the halved memory traffic; the totals below accumulate in
+    # float64 regardless.
+    arr = series.to_numpy()
+    if arr.dtype not in (np.float64, np.float32):
+        arr = pd.to_numeric(series, errors='coerce').to_numpy(dtype=np.float64)
+    return np.ascontiguousarray(arr)
+
+
+def _precompute(df):
+    """
+    Run the aggregations shared by all detectors in a single pass.
+
+    Returns None when there is no data, otherwise a dict with:
+        'columns' : set of column names (for per-detector guard messages)
+        'daily'   : per-date sums of the available value columns, date-sorted
+        'product' : per-product revenue/cost sums
+        'totals'  : (total_revenue, total_cost)
+    Pieces whose input columns are missing are left as None.
+
+    The frame is never deep-copied; when profit has to be derived it is
+    attached with assign, which shares the untouched columns.
+    """
+    if df is None or df.empty:
+        return None
+
+    columns = set(df.columns)
+
+    # Value columns as coerced float arrays, extracted once and
+    # shared by the daily aggregate and the totals below.
+    arrays = {col: _as_float_array(df[col])
+              for col in ('revenue', 'cost', 'profit') if col in columns}
+
+    # Derived profit stays a bare array: no frame copy, no new frame,
+    # just the one column the detectors actually read.
+    if 'profit' not in columns and 'revenue' in arrays and 'cost' in arrays:
+        arrays['profit'] = arrays['revenue'] - arrays['cost']
+        columns.add('profit')
+
+    # Zero-fill NaN only now, after profit is derived: for the plain
+    # sums a 0 contributes exactly what skipna skipped, and deriving
+    # first lets a NaN revenue or cost void the whole row's profit the
+    # way the old per-column groupby did.
+    for col, arr in arrays.items():
+        if np.isnan(arr).any():
+            arrays[col] = np.nan_to_num(arr)
+
+    pre = {'columns': columns, 'daily': None, 'product': None, 'totals': None}
+
+    value_cols = [c for c in ('revenue', 'cost', 'profit') if c in columns]
+    if 'date' in columns and value_cols:
+        # Segmented np.add.reduceat over date-sorted values replaces the
+        # groupby hash table: one stable argsort, then one contiguous
+        # sum per value column, all chronological.
+        # Append-style data is usually already chronological; a cheap
+        # monotonic check then skips the O(N log N) sort and the take.
+        dates = df['date'].to_numpy()
+
+        # The groupby dropped NaT group keys; the segmentation must
+        # drop malformed dates too, or they form a phantom trailing
+        # "day" that skews the endpoint and streak scans.
+        valid = ~pd.isna(dates)
+        clean = valid.all()
+        if not clean:
+            dates = dates[valid]
+
+        if clean and df['date'].is_monotonic_increasing:
+            order = None
+            uniq, seg_starts = np.unique(dates, return_index=True)
+        else:
+            order = np.argsort(dates, kind='stable')
+            uniq, seg_starts = np.unique(dates[order], return_index=True)
+
+        daily = {'date': uniq}
+        for col in value_cols:
+            vals = arrays[col] if clean else arrays[col][valid]
+            daily[col] = np.add.reduceat(vals if order is None else vals[order], seg_starts)
+
+        pre['daily'] = pd.DataFrame(daily)
+
+    if 'product_name' in columns and 'revenue' in arrays and 'cost' in arrays:
+        # Grouping on integer category codes beats hashing raw strings
+        # per row; sort=False also skips the final key sort, which the
+        # margin-ordered consumers never needed. Aggregating the coerced
+        # buffers keeps the groupby on the fast numeric path too.
+        prod = df['product_name']
+        if prod.dtype == object:
+            prod = prod.astype('category')
+        values = pd.DataFrame(
+            {'revenue': arrays['revenue'], 'cost': arrays['cost']}, index=df.index
+        )
+        pre['product'] = values.groupby(prod, sort=False, observed=True).sum()
+
+    if 'revenue' in arrays and 'cost' in arrays:
+        # One contiguous C-level reduction per column on the shared
+        # buffers extracted above; float64 accumulation keeps totals
+        # exact even over float32 storage.
+        pre['totals'] = (float(arrays['revenue'].sum(dtype=np.float64)),
+                         float(arrays['cost'].sum(dtype=np.float64)))
+
+    return pre
+
 
 def detect_continuous_losses(df, threshold_days=3):
     """
     Detect if business has continuous losses for consecutive days.
-    
+
     Args:
         df (DataFrame): Business data with 'date' and 'profit' columns
         threshold_days (int): Number of consecutive loss days to trigger warning
-        
+
     Returns:
         dict: {
             'risk_detected': bool,
@@ -32,69 +195,78 @@ def detect_continuous_losses(df, threshold_days=3):
             'message': str
         }
     """
-    if df is None or df.empty:
-        return {
-            'risk_detected': False,
-            'severity': 'low',
-            'consecutive_loss_days': 0,
-            'total_loss_amount': 0.0,
-            'loss_dates': [],
-            'message': 'No data available'
-        }
-    
-    # Check if profit column exists, otherwise calculate it
-    if 'profit' in df.columns:
-        df_copy = df.copy()
-    elif 'revenue' in df.columns and 'cost' in df.columns:
-        df_copy = df.copy()
-        df_copy['profit'] = df_copy['revenue'] - df_copy['cost']
+    return _continuous_losses_impl(_precompute(df), threshold_days)
+
+
+def _streak_dates(dates):
+    # Vectorized string formatting for the streak window. Boxing one
+    # Timestamp per element and calling str() on each allocates ~200
+    # bytes of Python object per date; strftime on a DatetimeIndex
+    # formats the whole datetime64 slice in one pass and produces the
+    # same 'YYYY-MM-DD HH:MM:SS' strings.
+    arr = np.asarray(dates)
+    if np.issubdtype(arr.dtype, np.datetime64):
+        return pd.DatetimeIndex(arr).strftime('%Y-%m-%d %H:%M:%S').tolist()
+    return [str(d) for d in dates]
+
+
+def _no_loss_result(message):
+    return {
+        'risk_detected': False,
+        'severity': 'low',
+        'consecutive_loss_days': 0,
+        'total_loss_amount': 0.0,
+        'loss_dates': [],
+        'message': message
+    }
+
+
+def _continuous_losses_impl(pre, threshold_days):
+    if pre is None:
+        return _no_loss_result('No data available')
+
+    if 'profit' not in pre['columns']:
+        return _no_loss_result('Required columns not found')
+
+    if 'date' not in pre['columns']:
+        return _no_loss_result('Date column not found')
+
+    daily_profit = pre['daily']
+
+    profit = daily_profit['profit'].to_numpy()
+
+    if _HAVE_NUMBA:
+        # Fused single-pass kernel: streak + total loss, no temporaries
+        best_len, best_start, best_end, total_loss = _scan_streak(profit)
+        max_consecutive = int(best_len)
+        total_loss = float(total_loss)
+        if max_consecutive:
+            max_streak_dates = _streak_dates(daily_profit['date'].to_numpy()[best_start:best_end])
+        else:
+            max_streak_dates = []
     else:
-        return {
-            'risk_detected': False,
-            'severity': 'low',
-            'consecutive_loss_days': 0,
-            'total_loss_amount': 0.0,
-            'loss_dates': [],
-            'message': 'Required columns not found'
-        }
-    
-    if 'date' not in df_copy.columns:
-        return {
-            'risk_detected': False,
-            'severity': 'low',
-            'consecutive_loss_days': 0,
-            'total_loss_amount': 0.0,
-            'loss_dates': [],
-            'message': 'Date column not found'
-        }
-    
-    # Group by date and calculate daily profit
-    df_sorted = df_copy.sort_values('date')
-    daily_profit = df_sorted.groupby('date')['profit'].sum().reset_index()
-    
-    # Find consecutive losses
-    consecutive = 0
-    max_consecutive = 0
-    current_streak_dates = []
-    max_streak_dates = []
-    total_loss = 0.0
-    
-    for idx, row in daily_profit.iterrows():
-        if row['profit'] < 0:
-            consecutive += 1
-            current_streak_dates.append(str(row['date']))
-            total_loss += abs(row['profit'])
-            
-            if consecutive > max_consecutive:
-                max_consecutive = consecutive
-                max_streak_dates = current_streak_dates.copy()
+        # Vectorized run-length scan: diff on the padded loss mask marks
+        # streak boundaries, so the longest run falls out of one argmax.
+        neg = profit < 0
+
+        total_loss = float(-profit[neg].sum()) if neg.any() else 0.0
+
+        boundaries = np.diff(np.concatenate(([0], neg.astype(np.int8), [0])))
+        starts = np.where(boundaries == 1)[0]
+        ends = np.where(boundaries == -1)[0]
+        lengths = ends - starts
+
+        if lengths.size:
+            i = int(lengths.argmax())
+            max_consecutive = int(lengths[i])
+            max_streak_dates = _streak_dates(daily_profit['date'].to_numpy()[starts[i]:ends[i]])
         else:
-            consecutive = 0
-            current_streak_dates = []
-    
+            max_consecutive = 0
+            max_streak_dates = []
+
     # Determine risk
     risk_detected = max_consecutive >= threshold_days
-    
+
     # Determine severity
     if max_consecutive >= 7:
         severity = 'high'
@@ -104,13 +276,13 @@ def detect_continuous_losses(df, threshold_days=3):
         severity = 'low'
     else:
         severity = 'low'
-    
+
     # Generate message
     if risk_detected:
         message = f"Warning: {max_consecutive} consecutive days of losses detected. Total loss: ₹{total_loss:,.2f}"
     else:
         message = "No continuous loss pattern detected"
-    
+
     return {
         'risk_detected': risk_detected,
         'severity': severity,
@@ -124,11 +296,11 @@ def detect_continuous_losses(df, threshold_days=3):
 def detect_declining_revenue(df, threshold_percent=-10):
     """
     Detect if revenue is declining over time.
-    
+
     Args:
         df (DataFrame): Business data with 'date' and 'revenue' columns
         threshold_percent (float): Percentage decline to trigger warning (negative value)
-        
+
     Returns:
         dict: {
             'risk_detected': bool,
@@ -138,52 +310,76 @@ def detect_declining_revenue(df, threshold_percent=-10):
             'message': str
         }
     """
-    if df is None or df.empty:
-        return {
-            'risk_detected': False,
-            'severity': 'low',
-            'decline_percent': 0.0,
-            'revenue_change': 0.0,
-            'message': 'No data available'
-        }
-    
-    required_cols = ['date', 'revenue']
-    if not all(col in df.columns for col in required_cols):
-        return {
-            'risk_detected': False,
-            'severity': 'low',
-            'decline_percent': 0.0,
-            'revenue_change': 0.0,
-            'message': 'Required columns not found'
-        }
-    
-    # Group by date and calculate daily revenue
-    df_sorted = df.sort_values('date')
-    daily_revenue = df_sorted.groupby('date')['revenue'].sum().reset_index()
-    
+    # Standalone fast path: only the first- and last-day sums matter,
+    # so two boolean-mask sums beat building the full daily aggregate.
+    if df is not None and not df.empty and 'date' in df.columns and 'revenue' in df.columns:
+        dates = df['date'].to_numpy()
+        rev = _as_float_array(df['revenue'])
+        if np.isnan(rev).any():
+            rev = np.nan_to_num(rev)
+
+        # NaT min/max poisons the endpoint masks the same way it does
+        # in _endpoint_sums; drop malformed dates like the grouped
+        # path drops NaT keys.
+        valid = ~pd.isna(dates)
+        if not valid.all():
+            dates = dates[valid]
+            rev = rev[valid]
+
+        if dates.size == 0:
+            return _no_decline_result('Insufficient data for trend analysis')
+
+        dmin = dates.min()
+        dmax = dates.max()
+
+        if dmin == dmax:
+            return _no_decline_result('Insufficient data for trend analysis')
+
+        first_revenue = float(rev[dates == dmin].sum(dtype=np.float64))
+        last_revenue = float(rev[dates == dmax].sum(dtype=np.float64))
+        return _declining_from_endpoints(first_revenue, last_revenue, threshold_percent)
+
+    return _declining_revenue_impl(_precompute(df), threshold_percent)
+
+
+def _no_decline_result(message):
+    return {
+        'risk_detected': False,
+        'severity': 'low',
+        'decline_percent': 0.0,
+        'revenue_change': 0.0,
+        'message': message
+    }
+
+
+def _declining_revenue_impl(pre, threshold_percent):
+    if pre is None:
+        return _no_decline_result('No data available')
+
+    if not {'date', 'revenue'} <= pre['columns']:
+        return _no_decline_result('Required columns not found')
+
+    daily_revenue = pre['daily']
+
     if len(daily_revenue) < 2:
-        return {
-            'risk_detected': False,
-            'severity': 'low',
-            'decline_percent': 0.0,
-            'revenue_change': 0.0,
-            'message': 'Insufficient data for trend analysis'
-        }
-    
-    # Calculate change from first to last
-    first_revenue = daily_revenue['revenue'].iloc[0]
-    last_revenue = daily_revenue['revenue'].iloc[-1]
-    
+        return _no_decline_result('Insufficient data for trend analysis')
+
+    # Change from first to last day
+    rev = daily_revenue['revenue'].to_numpy()
+    return _declining_from_endpoints(float(rev[0]), float(rev[-1]), threshold_percent)
+
+
+def _declining_from_endpoints(first_revenue, last_revenue, threshold_percent):
     revenue_change = last_revenue - first_revenue
-    
+
     if first_revenue == 0:
         decline_percent = 0.0
     else:
         decline_percent = (revenue_change / first_revenue) * 100
-    
+
     # Determine risk
     risk_detected = decline_percent <= threshold_percent
-    
+
     # Determine severity
     if decline_percent <= -20:
         severity = 'high'
@@ -193,13 +389,13 @@ def detect_declining_revenue(df, threshold_percent=-10):
         severity = 'low'
     else:
         severity = 'low'
-    
+
     # Generate message
     if risk_detected:
         message = f"Warning: Revenue declining by {abs(decline_percent):.2f}%. Change: ₹{revenue_change:,.2f}"
     else:
         message = "Revenue trend is stable or growing"
-    
+
     return {
         'risk_detected': risk_detected,
         'severity': severity,
@@ -212,11 +408,11 @@ def detect_declining_revenue(df, threshold_percent=-10):
 def detect_high_cost_ratio(df, threshold_ratio=0.8):
     """
     Detect if cost-to-revenue ratio is too high (low profit margin).
-    
+
     Args:
         df (DataFrame): Business data with 'revenue' and 'cost' columns
         threshold_ratio (float): Cost/Revenue ratio threshold (0.8 = 80% costs)
-        
+
     Returns:
         dict: {
             'risk_detected': bool,
@@ -226,43 +422,37 @@ def detect_high_cost_ratio(df, threshold_ratio=0.8):
             'message': str
         }
     """
-    if df is None or df.empty:
-        return {
-            'risk_detected': False,
-            'severity': 'low',
-            'cost_ratio': 0.0,
-            'profit_margin': 0.0,
-            'message': 'No data available'
-        }
-    
-    required_cols = ['revenue', 'cost']
-    if not all(col in df.columns for col in required_cols):
-        return {
-            'risk_detected': False,
-            'severity': 'low',
-            'cost_ratio': 0.0,
-            'profit_margin': 0.0,
-            'message': 'Required columns not found'
-        }
-    
-    total_revenue = df['revenue'].sum()
-    total_cost = df['cost'].sum()
-    
+    return _high_cost_ratio_impl(_precompute(df), threshold_ratio)
+
+
+def _no_cost_ratio_result(message):
+    return {
+        'risk_detected': False,
+        'severity': 'low',
+        'cost_ratio': 0.0,
+        'profit_margin': 0.0,
+        'message': message
+    }
+
+
+def _high_cost_ratio_impl(pre, threshold_ratio):
+    if pre is None:
+        return _no_cost_ratio_result('No data available')
+
+    if pre['totals'] is None:
+        return _no_cost_ratio_result('Required columns not found')
+
+    total_revenue, total_cost = pre['totals']
+
     if total_revenue == 0:
-        return {
-            'risk_detected': False,
-            'severity': 'low',
-            'cost_ratio': 0.0,
-            'profit_margin': 0.0,
-            'message': 'No revenue data'
-        }
-    
+        return _no_cost_ratio_result('No revenue data')
+
     cost_ratio = total_cost / total_revenue
     profit_margin = ((total_revenue - total_cost) / total_revenue) * 100
-    
+
     # Determine risk
     risk_detected = cost_ratio >= threshold_ratio
-    
+
     # Determine severity
     if cost_ratio >= 0.95:
         severity = 'high'
@@ -272,13 +462,13 @@ def detect_high_cost_ratio(df, threshold_ratio=0.8):
         severity = 'low'
     else:
         severity = 'low'
-    
+
     # Generate message
     if risk_detected:
         message = f"Warning: High cost ratio {cost_ratio*100:.1f}%. Profit margin only {profit_margin:.1f}%"
     else:
         message = f"Cost ratio is healthy at {cost_ratio*100:.1f}%"
-    
+
     return {
         'risk_detected': risk_detected,
         'severity': severity,
@@ -291,11 +481,11 @@ def detect_high_cost_ratio(df, threshold_ratio=0.8):
 def detect_low_profit_margin(df, threshold_margin=10.0):
     """
     Detect if overall profit margin is too low.
-    
+
     Args:
         df (DataFrame): Business data with 'revenue' and 'cost' columns
         threshold_margin (float): Minimum acceptable profit margin percentage
-        
+
     Returns:
         dict: {
             'risk_detected': bool,
@@ -305,43 +495,37 @@ def detect_low_profit_margin(df, threshold_margin=10.0):
             'message': str
         }
     """
-    if df is None or df.empty:
-        return {
-            'risk_detected': False,
-            'severity': 'low',
-            'profit_margin': 0.0,
-            'total_profit': 0.0,
-            'message': 'No data available'
-        }
-    
-    required_cols = ['revenue', 'cost']
-    if not all(col in df.columns for col in required_cols):
-        return {
-            'risk_detected': False,
-            'severity': 'low',
-            'profit_margin': 0.0,
-            'total_profit': 0.0,
-            'message': 'Required columns not found'
-        }
-    
-    total_revenue = df['revenue'].sum()
-    total_cost = df['cost'].sum()
+    return _low_profit_margin_impl(_precompute(df), threshold_margin)
+
+
+def _no_margin_result(message):
+    return {
+        'risk_detected': False,
+        'severity': 'low',
+        'profit_margin': 0.0,
+        'total_profit': 0.0,
+        'message': message
+    }
+
+
+def _low_profit_margin_impl(pre, threshold_margin):
+    if pre is None:
+        return _no_margin_result('No data available')
+
+    if pre['totals'] is None:
+        return _no_margin_result('Required columns not found')
+
+    total_revenue, total_cost = pre['totals']
     total_profit = total_revenue - total_cost
-    
+
     if total_revenue == 0:
-        return {
-            'risk_detected': False,
-            'severity': 'low',
-            'profit_margin': 0.0,
-            'total_profit': 0.0,
-            'message': 'No revenue data'
-        }
-    
+        return _no_margin_result('No revenue data')
+
     profit_margin = (total_profit / total_revenue) * 100
-    
+
     # Determine risk
     risk_detected = profit_margin < threshold_margin
-    
+
     # Determine severity
     if profit_margin < 0:
         severity = 'high'
@@ -351,7 +535,7 @@ def detect_low_profit_margin(df, threshold_margin=10.0):
         severity = 'low'
     else:
         severity = 'low'
-    
+
     # Generate message
     if risk_detected:
         if profit_margin < 0:
@@ -360,7 +544,7 @@ def detect_low_profit_margin(df, threshold_margin=10.0):
             message = f"Warning: Low profit margin {profit_margin:.2f}% (threshold: {threshold_margin}%)"
     else:
         message = f"Profit margin is healthy at {profit_margin:.2f}%"
-    
+
     return {
         'risk_detected': risk_detected,
         'severity': severity,
@@ -373,11 +557,11 @@ def detect_low_profit_margin(df, threshold_margin=10.0):
 def detect_underperforming_products(df, threshold_margin=5.0):
     """
     Detect products with low or negative profit margins.
-    
+
     Args:
         df (DataFrame): Business data with 'product_name', 'revenue', 'cost' columns
         threshold_margin (float): Minimum acceptable profit margin percentage per product
-        
+
     Returns:
         dict: {
             'risk_detected': bool,
@@ -386,62 +570,69 @@ def detect_underperforming_products(df, threshold_margin=5.0):
             'message': str
         }
     """
-    if df is None or df.empty:
-        return {
-            'risk_detected': False,
-            'underperforming_products': [],
-            'count': 0,
-            'message': 'No data available'
-        }
-    
-    required_cols = ['product_name', 'revenue', 'cost']
-    if not all(col in df.columns for col in required_cols):
-        return {
-            'risk_detected': False,
-            'underperforming_products': [],
-            'count': 0,
-            'message': 'Required columns not found'
+    return _underperforming_products_impl(_precompute(df), threshold_margin)
+
+
+def _no_products_result(message):
+    return {
+        'risk_detected': False,
+        'underperforming_products': [],
+        'count': 0,
+        'message': message
+    }
+
+
+def _underperforming_products_impl(pre, threshold_margin):
+    if pre is None:
+        return _no_products_result('No data available')
+
+    if pre['product'] is None:
+        return _no_products_result('Required columns not found')
+
+    agg = pre['product']
+    rev = agg['revenue'].to_numpy()
+    cost = agg['cost'].to_numpy()
+    profit = rev - cost
+
+    # Zero-revenue products get +inf so the threshold mask drops them,
+    # matching the old per-row 'continue'. With numba the whole thing
+    # is one compiled ufunc; otherwise a masked divide touches only the
+    # nonzero-revenue lanes (the *= leaves inf as inf).
+    if _HAVE_NUMBA:
+        margin = _margin_pct(profit, rev)
+    else:
+        margin = np.full_like(rev, np.inf)
+        np.divide(profit, rev, out=margin, where=rev != 0)
+        margin *= 100.0
+
+    mask = margin < threshold_margin
+
+    # Build dicts only for the offenders, worst margin first
+    order = np.argsort(margin[mask], kind='stable')
+    names = agg.index.to_numpy()[mask][order]
+
+    underperforming = [
+        {
+            'product': product,
+            'profit_margin': float(m),
+            'profit': float(p),
+            'revenue': float(r),
+            'cost': float(c)
         }
-    
-    # Calculate product-wise metrics
-    product_summary = df.groupby('product_name').agg({
-        'revenue': 'sum',
-        'cost': 'sum'
-    }).reset_index()
-    
-    underperforming = []
-    
-    for _, row in product_summary.iterrows():
-        product = row['product_name']
-        revenue = row['revenue']
-        cost = row['cost']
-        profit = revenue - cost
-        
-        if revenue == 0:
-            continue
-        
-        margin = (profit / revenue) * 100
-        
-        if margin < threshold_margin:
-            underperforming.append({
-                'product': product,
-                'profit_margin': float(margin),
-                'profit': float(profit),
-                'revenue': float(revenue),
-                'cost': float(cost)
-            })
-    
-    # Sort by margin (worst first)
-    underperforming.sort(key=lambda x: x['profit_margin'])
-    
+        for product, m, p, r, c in zip(
+            names, margin[mask][order], profit[mask][order],
+            rev[mask][order], cost[mask][order]
+        )
+    ]
+
     risk_detected = len(underperforming) > 0
-    
+
     # Generate message
     if risk_detected:
         message = f"Warning: {len(underperforming)} product(s) with margins below {threshold_margin}%"
     else:
         message = "All products performing well"
-    
+
     return {
         'risk_detected': risk_detected,
         'underperforming_products': underperforming,
@@ -453,29 +644,44 @@ def detect_underperforming_products(df, threshold_margin=5.0):
 def get_all_risks(df):
     """
     Run all risk detection functions and return comprehensive risk report.
-    
+
     Args:
         df (DataFrame): Business data
-        
+
     Returns:
         dict: All risk detection results with overall risk summary
     """
+    # One shared aggregation pass feeds every detector
+    pre = _precompute(df)
+
     risks = {
-        'continuous_losses': detect_continuous_losses(df),
-        'declining_revenue': detect_declining_revenue(df),
-        'high_cost_ratio': detect_high_cost_ratio(df),
-        'low_profit_margin': detect_low_profit_margin(df),
-        'underperforming_products': detect_underperforming_products(df)
+        'continuous_losses': _continuous_losses_impl(pre, 3),
+        'declining_revenue': _declining_revenue_impl(pre, -10),
+        'high_cost_ratio': _high_cost_ratio_impl(pre, 0.8),
+        'low_profit_margin': _low_profit_margin_impl(pre, 10.0),
+        'underperforming_products': _underperforming_products_impl(pre, 5.0)
     }
-    
-    # Count total risks detected
-    total_risks = sum(1 for risk in risks.values() if risk.get('risk_detected', False))
-    
-    # Count by severity
-    high_severity = sum(1 for risk in risks.values() if risk.get('severity') == 'high')
-    medium_severity = sum(1 for risk in risks.values() if risk.get('severity') == 'medium')
-    low_severity = sum(1 for risk in risks.values() if risk.get('severity') == 'low' and risk.get('risk_detected', False))
-    
+
+    # Tally detections and severities in one pass over the records
+    # instead of four separate generator scans.
+    total_risks = 0
+    high_severity = 0
+    medium_severity = 0
+    low_severity = 0
+
+    for risk in risks.values():
+        detected = risk.get('risk_detected', False)
+        if detected:
+            total_risks += 1
+
+        severity = risk.get('severity')
+        if severity == 'high':
+            high_severity += 1
+        elif severity == 'medium':
+            medium_severity += 1
+        elif severity == 'low' and detected:
+            low_severity += 1
+
     # Overall risk level
     if high_severity > 0:
         overall_risk = 'high'
@@ -485,7 +691,7 @@ def get_all_risks(df):
         overall_risk = 'low'
     else:
         overall_risk = 'none'
-    
+
     risks['summary'] = {
         'total_risks_detected': total_risks,
         'high_severity_count': high_severity,
@@ -493,5 +699,5 @@ def get_all_risks(df):
         'low_severity_count': low_severity,
         'overall_risk_level': overall_risk
     }
-    
-    return risks
\ No newline at end of file
+
+    return risks
@@ -1,17 +1,12 @@
-from google import genai
-from dotenv import load_dotenv
-import os
+import sys
 
-load_dotenv()
+from ai.ai_client import get_client
 
-api_key = os.getenv("GEMINI_API_KEY")
+client = get_client()
 
-if not api_key:
-    raise RuntimeError("GEMINI_API_KEY not found in environment")
+# Iterate the paginator directly so names print as pages arrive instead
+# of materializing the full list first; flush once at the end.
+for m in client.models.list():
+    sys.stdout.write(m.name + "\n")
 
-client = genai.Client(api_key=api_key)
-
-models = client.models.list()
-
-for m in models:
-    print(m.name)
+sys.stdout.flush()
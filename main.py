@@ -1,3 +1,5 @@
+import sys
+
 from core.data_loader import load_data
 from core.data_validator import validate_dataframe
 
@@ -21,19 +23,23 @@ def run_pipeline(csv_path):
     df_mapped = map_to_internal_schema(df_raw)
     df = validate_dataframe(df_mapped)
 
-    print("Data loaded, mapped & validated ")
-
+    # Collect the report and emit it with one write instead of a
+    # print (and stdout lock + flush) per line.
+    lines = ["Data loaded, mapped & validated "]
 
     if total_revenue:
-            print("Total Revenue:", total_revenue(df))
-            print("Total Cost:", total_cost(df))
-            print("Total Profit:", total_profit(df))
-            print("Profit Margin:", profit_margin(df))
-            print(product_wise_summary(df))
+        lines.append(f"Total Revenue: {total_revenue(df)}")
+        lines.append(f"Total Cost: {total_cost(df)}")
+        lines.append(f"Total Profit: {total_profit(df)}")
+        lines.append(f"Profit Margin: {profit_margin(df)}")
+        lines.append(str(product_wise_summary(df)))
     else:
-            print("Analytics module not available yet.")
-    
-    
-    if __name__ == "__main__":
-        run_pipeline("data/sample_data.csv")
-    
\ No newline at end of file
+        lines.append("Analytics module not available yet.")
+
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+if __name__ == "__main__":
+    # Default to a CSV that ships with the repo; pass a path to run
+    # the pipeline over a different file.
+    run_pipeline(sys.argv[1] if len(sys.argv) > 1 else "data/Dataset1.csv")
@@ -4,6 +4,24 @@ from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Image
 from reportlab.lib.styles import getSampleStyleSheet
 from io import BytesIO
 
+from PIL import Image as PILImage
+
+
+def _prepared_image(img_bytes):
+    # Charts render at 400x250 points but arrive as full-resolution
+    # bitmaps; downscale once with PIL (2x the draw size for sharpness)
+    # so reportlab neither embeds nor decodes megapixel PNGs. Small
+    # images pass through untouched.
+    img = PILImage.open(BytesIO(img_bytes))
+    if img.width > 800:
+        img.thumbnail((800, 500), PILImage.BILINEAR)
+        out = BytesIO()
+        img.save(out, "PNG")
+        out.seek(0)
+        return out
+    return BytesIO(img_bytes)
+
+
 def generate_pdf_report(metrics, risks, ai_insights, chart_files):
     buffer = BytesIO()
     doc = SimpleDocTemplate(buffer)
@@ -31,8 +49,7 @@ def generate_pdf_report(metrics, risks, ai_insights, chart_files):
 
     # 🔥 Charts from BYTES (not files)
     for name, img_bytes in chart_files.items():
-        img_stream = BytesIO(img_bytes)
-        elements.append(Image(img_stream, width=400, height=250))
+        elements.append(Image(_prepared_image(img_bytes), width=400, height=250))
         elements.append(Spacer(1, 12))
 
     doc.build(elements)
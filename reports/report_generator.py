@@ -1,17 +1,18 @@
-def generate_report(metrics: dict, risks: list, ai_insights: str):
-    report = []
+# Invariant pieces built once at import instead of per report; batch
+# runs generate thousands of these.
+_SEPARATOR = "-" * 30
+_HEADER = "BIZSIGHT BUSINESS REPORT\n" + _SEPARATOR
+
 
-    report.append("BIZSIGHT BUSINESS REPORT")
-    report.append("-" * 30)
+def generate_report(metrics: dict, risks: list, ai_insights: str):
+    report = [_HEADER]
 
     report.append("\nKEY METRICS:")
-    for key, value in metrics.items():
-        report.append(f"{key}: {value}")
+    report.extend(f"{key}: {value}" for key, value in metrics.items())
 
     report.append("\nDETECTED RISKS:")
     if risks:
-        for risk in risks:
-            report.append(f"- {risk}")
+        report.extend(f"- {risk}" for risk in risks)
     else:
         report.append("No major risks detected")
 
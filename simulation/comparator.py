@@ -1,9 +1,33 @@
-def compare_profit(original_df, simulated_df):
-    original_profit = original_df["profit"].sum()
-    simulated_profit = simulated_df["profit"].sum()
+import numpy as np
+
+
+def compare_profit(original_df, simulated_df, original_profit=None):
+    # Sum the raw buffers: skips pandas' nan-handling dispatch, which
+    # matters when this runs once per scenario in a sweep. Callers
+    # looping over scenarios can pass the original total so the
+    # unchanged frame is not re-summed on every call.
+    if original_profit is None:
+        original_profit = float(original_df["profit"].to_numpy().sum())
+    simulated_profit = float(simulated_df["profit"].to_numpy().sum())
 
     return {
         "original_profit": original_profit,
         "simulated_profit": simulated_profit,
         "difference": simulated_profit - original_profit
     }
+
+
+def compare_profit_batch(original_df, simulated_dfs):
+    """
+    Compare many simulated frames against one original.
+
+    The original profit total is computed once and reused, instead of
+    once per comparison as the single-frame API forces. Returns a list
+    of compare_profit-shaped dicts in input order.
+    """
+    original_profit = float(original_df["profit"].to_numpy().sum())
+
+    return [
+        compare_profit(original_df, simulated_df, original_profit=original_profit)
+        for simulated_df in simulated_dfs
+    ]
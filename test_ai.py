@@ -1,19 +1,33 @@
+from functools import lru_cache
+
 from groq import Groq
 import streamlit as st
 
+
+@lru_cache(maxsize=1)
+def _get_api_key():
+    # Lazy lookup so st.secrets is only read once per process
+    return st.secrets.get("GROQ_API_KEY")
+
+
+@lru_cache(maxsize=1)
+def get_client():
+    # One client per process: it holds the connection pool, so repeated
+    # calls reuse the TLS session instead of re-handshaking each time
+    return Groq(api_key=_get_api_key(), max_retries=3, timeout=30.0)
+
+
 def main():
     print("🔍 Testing Groq API...")
 
     try:
-        api_key = st.secrets.get("GROQ_API_KEY")
-
-        if not api_key:
+        if not _get_api_key():
             print("❌ GROQ_API_KEY not found in Streamlit secrets")
             return
 
         print("✅ API key found")
 
-        client = Groq(api_key=api_key)
+        client = get_client()
 
         response = client.chat.completions.create(
             model="llama-3.1-8b-instant",
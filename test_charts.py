@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 from visualization.charts import (
     revenue_trend_chart,
@@ -5,16 +6,20 @@ from visualization.charts import (
     revenue_contribution_pie
 )
 
-# Dummy data
+# Dummy data, built once at module load from typed arrays so repeated
+# runs skip the dict-of-lists type inference; the charts only read it.
+_DATES = pd.to_datetime(["2024-01-01", "2024-02-01", "2024-03-01"])
+_REVENUE = np.array([1000.0, 1500.0, 1200.0])
+_COST = np.array([700.0, 900.0, 800.0])
+
 df = pd.DataFrame({
-    "Date": ["2024-01-01", "2024-02-01", "2024-03-01"],
-    "Product": ["A", "B", "A"],
-    "Revenue": [1000, 1500, 1200],
-    "Cost": [700, 900, 800]
+    "date": _DATES,
+    "product_name": ["A", "B", "A"],
+    "revenue": _REVENUE,
+    "cost": _COST,
+    "profit": _REVENUE - _COST
 })
 
-df["Profit"] = df["Revenue"] - df["Cost"]
-
 # Show charts
 revenue_trend_chart(df).show()
 profit_by_product_chart(df).show()
@@ -0,0 +1,83 @@
+import argparse
+import asyncio
+import sys
+
+from ai.ai_client import get_client
+from core.config import get_settings
+
+MODEL_NAME = "gemini-2.0-flash"
+
+DEFAULT_PROMPTS = [
+    "Reply with exactly this sentence: Gemini AI is working perfectly.",
+    "Reply with exactly one word: pong",
+]
+
+
+async def _run(client, prompts, batch_size):
+    # All prompts go out concurrently so the wall clock is one round
+    # trip instead of one per prompt; the semaphore caps in-flight
+    # requests to stay clear of rate limits.
+    semaphore = asyncio.Semaphore(batch_size)
+
+    async def ask(prompt):
+        async with semaphore:
+            return await client.aio.models.generate_content(
+                model=MODEL_NAME,
+                contents=prompt
+            )
+
+    return await asyncio.gather(*(ask(p) for p in prompts), return_exceptions=True)
+
+
+def _stream_prompt(client, prompt):
+    # Print tokens as they arrive instead of blocking on the full
+    # completion: perceived latency drops to time-to-first-token and
+    # the decode overlaps the network flushes.
+    print(f"✅ {prompt}")
+    for chunk in client.models.generate_content_stream(model=MODEL_NAME, contents=prompt):
+        if chunk.text:
+            sys.stdout.write(chunk.text)
+            sys.stdout.flush()
+    sys.stdout.write("\n")
+
+
+def main(prompts=None, batch_size=4, stream=False):
+    print("🔍 Testing Gemini API...")
+
+    api_key = get_settings().gemini_key
+
+    if not api_key:
+        print("❌ GEMINI_API_KEY not found in environment")
+        return
+
+    print("✅ API key found")
+
+    client = get_client()
+    prompts = list(prompts) if prompts else DEFAULT_PROMPTS
+
+    if stream:
+        for prompt in prompts:
+            try:
+                _stream_prompt(client, prompt)
+            except Exception as e:
+                print(f"❌ {prompt}\n   {e}")
+        return
+
+    results = asyncio.run(_run(client, prompts, batch_size))
+
+    for prompt, result in zip(prompts, results):
+        if isinstance(result, Exception):
+            print(f"❌ {prompt}\n   {result}")
+        else:
+            print(f"✅ {prompt}\n   {result.text}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Smoke-test the Gemini API")
+    parser.add_argument("prompts", nargs="*", help="prompts to send (defaults to built-in probes)")
+    parser.add_argument("--batch-size", type=int, default=4,
+                        help="max concurrent requests (default: 4)")
+    parser.add_argument("--stream", action="store_true",
+                        help="stream each response as tokens arrive instead of batching")
+    args = parser.parse_args()
+    main(prompts=args.prompts, batch_size=args.batch_size, stream=args.stream)
@@ -1,4 +1,8 @@
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
 from core.data_loader import load_data
+from core.data_mapper import map_to_internal_schema
 from core.data_validator import validate_dataframe
 from analysis.trends import (
     revenue_trend,
@@ -10,27 +14,34 @@ from analysis.trends import (
 )
 
 # Load test data
-df = load_data("data/sample_data.csv")
-df = validate_dataframe(df)
-
-print("===== REVENUE TREND =====")
-print(revenue_trend(df))
-
-print("\n===== PROFIT TREND =====")
-print(profit_trend(df))
-
-print("\n===== OVERALL GROWTH RATE =====")
-print(growth_rate(df, "overall"))
-
-print("\n===== AVERAGE GROWTH RATE =====")
-print(growth_rate(df, "average"))
-
-print("\n===== CONSECUTIVE LOSSES =====")
-print(detect_consecutive_losses(df))
-
-print("\n===== PRODUCT TREND RANKING =====")
-for item in product_trend_ranking(df):
-    print(item)
-
-print("\n===== ALL TRENDS (SUMMARY) =====")
-print(get_all_trends(df))
+df = load_data("data/Dataset1.csv")
+df = validate_dataframe(map_to_internal_schema(df))
+
+# All the trend functions are read-only on the same frame, and their
+# pandas/NumPy kernels release the GIL, so run them concurrently and
+# collect the results in display order.
+jobs = [
+    ("===== REVENUE TREND =====", revenue_trend, ()),
+    ("\n===== PROFIT TREND =====", profit_trend, ()),
+    ("\n===== OVERALL GROWTH RATE =====", growth_rate, ("overall",)),
+    ("\n===== AVERAGE GROWTH RATE =====", growth_rate, ("average",)),
+    ("\n===== CONSECUTIVE LOSSES =====", detect_consecutive_losses, ()),
+    ("\n===== PRODUCT TREND RANKING =====", product_trend_ranking, ()),
+    ("\n===== ALL TRENDS (SUMMARY) =====", get_all_trends, ()),
+]
+
+with ThreadPoolExecutor(max_workers=len(jobs)) as pool:
+    futures = [(header, pool.submit(fn, df, *args)) for header, fn, args in jobs]
+    results = [(header, future.result()) for header, future in futures]
+
+# Build the whole report and write it once instead of a print (and
+# stdout lock) per section.
+sections = []
+for header, result in results:
+    sections.append(header)
+    if isinstance(result, list):
+        sections.extend(str(item) for item in result)
+    else:
+        sections.append(str(result))
+
+sys.stdout.write("\n".join(sections) + "\n")
@@ -1,3 +1,5 @@
+from concurrent.futures import ThreadPoolExecutor
+
 import pandas as pd
 
 from visualization.charts import (
@@ -10,28 +12,39 @@ from simulation.comparator import compare_profit
 from reports.report_generator import generate_report
 
 # ---- Sample Data ----
-#df = pd.DataFrame({
-#    "Date": ["2024-01-01", "2024-02-01", "2024-03-01"],
-#    "Product": ["A", "B", "A"],
-#    "Revenue": [1000, 1500, 1200],
-#    "Cost": [700, 900, 800]
-#})
+df = pd.DataFrame({
+    "date": pd.to_datetime(["2024-01-01", "2024-02-01", "2024-03-01"]),
+    "product_name": ["A", "B", "A"],
+    "revenue": [1000, 1500, 1200],
+    "cost": [700, 900, 800]
+})
+
+# eval derives the column in one fused expression (and multithreads
+# through numexpr when it is installed)
+df = df.eval("profit = revenue - cost")
 
-df["profit"] = df["revenue"] - df["cost"]
+# One shared per-product aggregate feeds both product charts below
+by_product = df.groupby("product_name")[["revenue", "profit"]].sum()
 
 # ---- Simulation ----
 simulated_df = simulate_changes(df, revenue_change_pct=10, cost_change_pct=-5)
 
 comparison = compare_profit(df, simulated_df)
 
-print("\nSIMULATION OUTPUT:")
-print(comparison)
+# Format the comparison once and print it in a single call instead of
+# formatting per value while printing.
+comparison_text = "\n".join(f"{k}: {v:,.2f}" for k, v in comparison.items())
+print("\nSIMULATION OUTPUT:\n" + comparison_text)
 
 # ---- Report ----
+# One fused reduction over the three columns instead of three separate
+# Series sums
+totals = simulated_df[["revenue", "cost", "profit"]].sum()
+
 metrics = {
-    "Total Revenue": simulated_df["revenue"].sum(),
-    "Total Cost": simulated_df["cost"].sum(),
-    "Total Profit": simulated_df["profit"].sum()
+    "Total Revenue": totals["revenue"],
+    "Total Cost": totals["cost"],
+    "Total Profit": totals["profit"]
 }
 
 risks = ["High cost ratio detected"]
@@ -43,6 +56,15 @@ print("\nFINAL REPORT OUTPUT:")
 print(final_report)
 
 # ---- Charts ----
-revenue_trend_chart(df).show()
-profit_by_product_chart(df).show()
-revenue_contribution_pie(df).show()
+# The three figures are independent, so build them concurrently (the
+# pandas aggregations inside release the GIL) and show them in order.
+with ThreadPoolExecutor(max_workers=3) as pool:
+    jobs = (
+        pool.submit(revenue_trend_chart, df),
+        pool.submit(profit_by_product_chart, df, by_product),
+        pool.submit(revenue_contribution_pie, df, by_product),
+    )
+    figures = [job.result() for job in jobs]
+
+for fig in figures:
+    fig.show()
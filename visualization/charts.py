@@ -1,33 +1,122 @@
-import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
 import plotly.express as px
+import plotly.graph_objects as go
+
+from analysis.analyzer import month_codes
+
+# Above this many points an SVG line chart gets DOM-bound in the
+# browser; long series switch to a WebGL trace instead.
+_WEBGL_THRESHOLD = 500
+
+# Shared styling built once at import; every chart passes the same
+# template so each builder reuses this dict instead of respelling it.
+_BASE_LAYOUT = {"template": "plotly_white"}
+
+
+def _product_key(df):
+    # Grouping on category codes hashes small integers instead of one
+    # Python string per row; alphabetical category order keeps the
+    # grouped output in the same order as the plain string groupby.
+    key = df["product_name"]
+    if key.dtype == object:
+        key = key.astype("category")
+    return key
+
+
+def revenue_trend_spec(df: pd.DataFrame):
+    """
+    The monthly revenue trend as a plain {'x', 'y', 'title'} dict.
+
+    A spec is a few lists instead of a live Figure object, so it
+    pickles cleanly and can be cached or shipped to a worker; the chart
+    function below materializes the Figure from it.
+    """
+    # Only date and revenue are read, so work on the date Series
+    # directly instead of copying the whole frame just to hold a
+    # parsed date column.
+    dates = df["date"]
+
+    # Frames straight from the pipeline already carry datetime64 dates;
+    # skip re-parsing those. String dates try the C-level ISO8601 path
+    # first (cache=True dedups repeated dates) and fall back to full
+    # inference for other formats.
+    if not pd.api.types.is_datetime64_any_dtype(dates):
+        try:
+            dates = pd.to_datetime(dates, format="ISO8601", cache=True)
+        except (TypeError, ValueError):
+            dates = pd.to_datetime(dates, cache=True)
+
+    # Sample frames often arrive as one row per first-of-month date
+    # already in order — the monthly aggregation is then the identity,
+    # so skip the factorize and bincount outright.
+    if (len(dates) > 1 and dates.is_unique and dates.is_monotonic_increasing
+            and (dates.dt.day == 1).all()):
+        months = dates.to_numpy().astype("datetime64[M]")
+        return {
+            "x": np.datetime_as_string(months, unit="M").tolist(),
+            "y": df["revenue"].to_numpy(dtype=np.float64).tolist(),
+            "title": "Monthly Revenue Trend"
+        }
+
+    # Factorized month codes + bincount instead of to_period: the
+    # grouping stays on int64 datetime64 math with no Python Period
+    # object allocated per row, and the labels come from one vectorized
+    # datetime_as_string call.
+    codes, unique = month_codes(dates)
+    revenue = np.bincount(codes, weights=df["revenue"].to_numpy(dtype=np.float64),
+                          minlength=len(unique))
+
+    return {
+        "x": np.datetime_as_string(unique, unit="M").tolist(),
+        "y": revenue.tolist(),
+        "title": "Monthly Revenue Trend"
+    }
 
-def revenue_trend_chart(df: pd.DataFrame):
-    df = df.copy()
-    df["date"] = pd.to_datetime(df["date"])
-    df["month"] = df["date"].dt.to_period("M").astype(str)
-
-    grouped = df.groupby("month", as_index=False)["revenue"].sum()
 
-    fig = px.line(
-        grouped,
-        x="month",
-        y="revenue",
-        markers=True,
-        title="Monthly Revenue Trend",
-    )
+def revenue_trend_chart(df: pd.DataFrame):
+    spec = revenue_trend_spec(df)
+
+    grouped = pd.DataFrame({
+        "month": spec["x"],
+        "revenue": spec["y"]
+    })
+
+    if len(grouped) < _WEBGL_THRESHOLD:
+        fig = px.line(
+            grouped,
+            x="month",
+            y="revenue",
+            markers=True,
+            title=spec["title"],
+        )
+    else:
+        # Bare go.Figure skips px's frame inspection, and Scattergl
+        # renders through WebGL instead of one SVG node per point
+        fig = go.Figure(go.Scattergl(
+            x=grouped["month"],
+            y=grouped["revenue"],
+            mode="lines+markers"
+        ))
+        fig.update_layout(title=spec["title"])
 
     fig.update_layout(
         hovermode="x unified",
-        template="plotly_white"
+        **_BASE_LAYOUT
     )
 
     return fig
 
 
 
-def profit_by_product_chart(df: pd.DataFrame):
-    grouped = df.groupby("product_name", as_index=False)["profit"].sum()
+def profit_by_product_chart(df: pd.DataFrame, by_product: pd.DataFrame = None):
+    # Callers building several product charts can pass one shared
+    # per-product aggregate (product_name index, revenue/profit
+    # columns) instead of paying the groupby once per chart.
+    if by_product is not None:
+        grouped = by_product.reset_index()[["product_name", "profit"]]
+    else:
+        grouped = df.groupby(_product_key(df), observed=True)["profit"].sum().reset_index()
 
     fig = px.bar(
         grouped,
@@ -40,15 +129,19 @@ def profit_by_product_chart(df: pd.DataFrame):
     fig.update_layout(
         xaxis_title="Product",
         yaxis_title="Profit",
-        template="plotly_white"
+        **_BASE_LAYOUT
     )
 
     return fig
 
 
 
-def revenue_contribution_pie(df: pd.DataFrame):
-    grouped = df.groupby("product_name", as_index=False)["revenue"].sum()
+def revenue_contribution_pie(df: pd.DataFrame, by_product: pd.DataFrame = None):
+    # Same shared-aggregate shortcut as profit_by_product_chart
+    if by_product is not None:
+        grouped = by_product.reset_index()[["product_name", "revenue"]]
+    else:
+        grouped = df.groupby(_product_key(df), observed=True)["revenue"].sum().reset_index()
 
     fig = px.pie(
         grouped,
@@ -60,7 +153,7 @@ def revenue_contribution_pie(df: pd.DataFrame):
 
     fig.update_traces(textposition="inside", textinfo="percent")
 
-    fig.update_layout(template="plotly_white")
+    fig.update_layout(**_BASE_LAYOUT)
 
     return fig
 